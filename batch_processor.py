@@ -9,7 +9,18 @@ import logging
 import time
 from collections import defaultdict
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -129,21 +140,23 @@ class BatchFileProcessor:
 
         logger.info(f"Starting batch scan of {directory_path}")
 
-        # First pass: count files for progress tracking
-        total_files = sum(
-            1 for _ in self._iter_matching_files(directory_path, extensions)
-        )
-        logger.info(f"Found {total_files} files to process")
+        files: Iterable[Path] = self._iter_matching_files(directory_path, extensions)
+        progress_tracker = None
+        total_files = 0
 
         if progress_callback:
+            # Progress needs a total up front; keep the single walk's results
+            # rather than walking the tree a second time
+            files = list(files)
+            total_files = len(files)
+            logger.info(f"Found {total_files} files to process")
             progress_tracker = ProgressTracker(total_files, progress_callback)
-        else:
-            progress_tracker = None
 
-        # Second pass: yield files in batches
         current_batch = []
 
-        for file_path in self._iter_matching_files(directory_path, extensions):
+        for file_path in files:
+            if not progress_tracker:
+                total_files += 1
             current_batch.append(file_path)
 
             if progress_tracker:
@@ -171,12 +184,13 @@ class BatchFileProcessor:
         Yields:
             Matching file paths
         """
-        try:
-            for file_path in directory.rglob("*"):
-                if file_path.is_file() and file_path.suffix.lower() in extensions:
-                    yield file_path
-        except (PermissionError, OSError) as e:
-            logger.warning(f"Error accessing {directory}: {e}")
+        from rom_utils import iter_rom_files
+
+        # The walker expects lowercase suffixes; normalize them once per scan
+        extensions = frozenset(ext.lower() for ext in extensions)
+
+        for entry in iter_rom_files(directory, extensions, skip_dirs=()):
+            yield Path(entry.path)
 
     def process_file_batches(
         self,
@@ -303,13 +317,30 @@ class ROMBatchScanner:
         Returns:
             Dictionary mapping canonical names to lists of (file_path, region, original_name) tuples
         """
-        from rom_utils import get_base_name, get_region
+        from rom_utils import parse_rom_filenames
 
         rom_groups = defaultdict(list)
 
-        total_files = sum(
-            1 for _ in self.processor._iter_matching_files(Path(directory), extensions)
+        directory_path = Path(directory)
+        if not directory_path.exists():
+            raise FileNotFoundError(f"Directory not found: {directory}")
+
+        # One walk feeds both the progress total and the batches
+        all_files = list(
+            self.processor._iter_matching_files(directory_path, extensions)
+        )
+        total_files = len(all_files)
+
+        # Parse every unseen name up front; large sets use a process pool
+        parsed_names = self._name_cache if self.cache_enabled else {}
+        pending = list(
+            dict.fromkeys(
+                file_path.name
+                for file_path in all_files
+                if file_path.name not in parsed_names
+            )
         )
+        parsed_names.update(zip(pending, parse_rom_filenames(pending)))
 
         def process_rom_file(
             file_path: Path,
@@ -322,18 +353,7 @@ class ROMBatchScanner:
             """
             try:
                 filename = file_path.name
-
-                # Check cache first
-                if self.cache_enabled and filename in self._name_cache:
-                    base_name, region = self._name_cache[filename]
-                else:
-                    # Parse filename
-                    base_name = get_base_name(filename)
-                    region = get_region(filename)
-
-                    # Cache the result
-                    if self.cache_enabled:
-                        self._name_cache[filename] = (base_name, region)
+                base_name, region = parsed_names[filename]
 
                 if not base_name:
                     return False, f"Could not parse game name from {filename}"
@@ -344,8 +364,10 @@ class ROMBatchScanner:
                 return False, str(e)
 
         # Process files in batches
-        file_batches = self.processor.scan_files_batch(
-            directory, extensions, progress_callback
+        batch_size = self.processor.batch_size
+        file_batches = (
+            all_files[start : start + batch_size]
+            for start in range(0, total_files, batch_size)
         )
         batch_results = self.processor.process_file_batches(
             file_batches,
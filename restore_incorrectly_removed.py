@@ -14,13 +14,19 @@ Usage: python restore_incorrectly_removed.py [rom_directory]
 
 import argparse
 import logging
-import shutil
 import sys
 from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List
 
-from rom_utils import get_base_name, get_region, get_version_info, is_multi_disc_game
+from rom_cleanup import move_file
+from rom_utils import (
+    get_base_name,
+    get_region,
+    get_version_info,
+    is_multi_disc_game,
+    iter_rom_files,
+)
 
 # Setup logging
 logging.basicConfig(
@@ -60,11 +66,10 @@ def analyze_removed_files(removed_folder: Path) -> Dict[str, List[Path]]:
         ".md",
         ".gen",
     }
-    rom_files = []
-
-    for file_path in removed_folder.rglob("*"):
-        if file_path.is_file() and file_path.suffix.lower() in rom_extensions:
-            rom_files.append(file_path)
+    rom_files = [
+        Path(entry.path)
+        for entry in iter_rom_files(removed_folder, rom_extensions, skip_dirs=())
+    ]
 
     logger.info(f"Found {len(rom_files)} ROM files in removed folder")
 
@@ -85,18 +90,21 @@ def identify_files_to_restore(
 
     logger.info("Analyzing removed files for restoration...")
 
+    # Index the main directory once, keeping only files whose base name has
+    # removed counterparts; everything else can never affect a restore decision
+    remaining_by_base = defaultdict(list)
+    for entry in iter_rom_files(
+        main_directory, None, skip_dirs=("removed_duplicates", "to_delete")
+    ):
+        base_name = get_base_name(entry.name)
+        if base_name in removed_groups:
+            remaining_by_base[base_name].append(Path(entry.path))
+
     for base_name, removed_files in removed_groups.items():
         logger.info(f"\\nAnalyzing: {base_name} ({len(removed_files)} removed files)")
 
         # Check what's still in the main directory
-        remaining_files = []
-        for file_path in main_directory.rglob("*"):
-            if (
-                file_path.is_file()
-                and get_base_name(file_path.name) == base_name
-                and file_path.parent.name not in ["removed_duplicates", "to_delete"]
-            ):
-                remaining_files.append(file_path)
+        remaining_files = remaining_by_base.get(base_name, [])
 
         logger.info(f"  Remaining in main directory: {len(remaining_files)}")
         for f in remaining_files:
@@ -187,7 +195,7 @@ def restore_files(
                 dest_path.parent.mkdir(parents=True, exist_ok=True)
 
                 # Move the file
-                shutil.move(str(file_path), str(dest_path))
+                move_file(file_path, dest_path)
                 restored_count += 1
             except Exception as e:
                 logger.error(f"    ERROR: {e}")
@@ -15,187 +15,334 @@ Options:
 """
 
 import argparse
+import errno
 import json
 import logging
+import multiprocessing
 import os
 import re
 import shutil
 import sys
+import threading
 import time
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from difflib import SequenceMatcher
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Pattern, Set, Tuple, Union
 
-from rom_utils import get_base_name, get_region, get_version_info, is_multi_disc_game
+from rom_utils import (
+    get_version_info,
+    is_multi_disc_game,
+    iter_rom_files,
+    name_similarities,
+    parse_rom_filenames,
+)
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     requests = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:
+    fuzz = None
+    process = None
+
 # Common ROM file extensions
-DEFAULT_ROM_EXTENSIONS = {
-    # Archive formats
-    ".zip",
-    ".7z",
-    ".rar",
-    # Nintendo systems
-    ".nes",
-    ".snes",
-    ".smc",
-    ".sfc",
-    ".gb",
-    ".gbc",
-    ".gba",
-    ".nds",
-    ".3ds",
-    ".cia",
-    ".n64",
-    ".z64",
-    ".v64",
-    ".ndd",
-    ".gcm",
-    ".gcz",
-    ".rvz",
-    ".wbfs",
-    ".xci",
-    ".nsp",
-    ".vb",
-    ".lnx",
-    ".ngp",
-    ".ngc",
-    # Sega systems
-    ".md",
-    ".gen",
-    ".smd",
-    ".gg",
-    ".sms",
-    ".32x",
-    ".sat",
-    ".gdi",
-    # Sony systems
-    ".bin",
-    ".iso",
-    ".cue",
-    ".chd",
-    ".pbp",
-    ".cso",
-    ".ciso",
-    # PC Engine/TurboGrafx
-    ".pce",
-    ".sgx",
-    # Atari systems
-    ".a26",
-    ".a78",
-    ".st",
-    ".d64",
-    # Other retro systems
-    ".col",
-    ".int",
-    ".vec",
-    ".ws",
-    ".wsc",
-    # Disk images
-    ".img",
-    ".ima",
-    ".dsk",
-    ".adf",
-    ".mdf",
-    ".nrg",
-    # Tape formats
-    ".tap",
-    ".tzx",
-    # Spectrum formats
-    ".sna",
-    ".z80",
-}
+DEFAULT_ROM_EXTENSIONS = frozenset(
+    {
+        # Archive formats
+        ".zip",
+        ".7z",
+        ".rar",
+        # Nintendo systems
+        ".nes",
+        ".snes",
+        ".smc",
+        ".sfc",
+        ".gb",
+        ".gbc",
+        ".gba",
+        ".nds",
+        ".3ds",
+        ".cia",
+        ".n64",
+        ".z64",
+        ".v64",
+        ".ndd",
+        ".gcm",
+        ".gcz",
+        ".rvz",
+        ".wbfs",
+        ".xci",
+        ".nsp",
+        ".vb",
+        ".lnx",
+        ".ngp",
+        ".ngc",
+        # Sega systems
+        ".md",
+        ".gen",
+        ".smd",
+        ".gg",
+        ".sms",
+        ".32x",
+        ".sat",
+        ".gdi",
+        # Sony systems
+        ".bin",
+        ".iso",
+        ".cue",
+        ".chd",
+        ".pbp",
+        ".cso",
+        ".ciso",
+        # PC Engine/TurboGrafx
+        ".pce",
+        ".sgx",
+        # Atari systems
+        ".a26",
+        ".a78",
+        ".st",
+        ".d64",
+        # Other retro systems
+        ".col",
+        ".int",
+        ".vec",
+        ".ws",
+        ".wsc",
+        # Disk images
+        ".img",
+        ".ima",
+        ".dsk",
+        ".adf",
+        ".mdf",
+        ".nrg",
+        # Tape formats
+        ".tap",
+        ".tzx",
+        # Spectrum formats
+        ".sna",
+        ".z80",
+    }
+)
 
 logger = logging.getLogger(__name__)
 
-GAME_CACHE = {}
+# Canonical names keyed by (lowercased game name, file extension)
+GAME_CACHE: Dict[Tuple[str, str], str] = {}
 CACHE_FILE = Path("game_cache.json")
+CACHE_TTL_SECONDS = 30 * 24 * 60 * 60  # Re-query the API after 30 days
+# When each loaded GAME_CACHE entry was resolved; new entries are stamped on save
+_GAME_CACHE_TIMESTAMPS: Dict[Tuple[str, str], int] = {}
 IGDB_CLIENT_ID = os.getenv("IGDB_CLIENT_ID")
 IGDB_ACCESS_TOKEN = os.getenv("IGDB_ACCESS_TOKEN")
+IGDB_API_URL = "https://api.igdb.com/v4"
+IGDB_MULTIQUERY_LIMIT = 10  # Sub-queries allowed per multiquery request
+IGDB_MAX_WORKERS = 4  # Concurrent IGDB requests (IGDB allows up to 8 open)
+FILE_OP_WORKERS = min(16, (os.cpu_count() or 1) * 4)  # Concurrent file moves
+
+# Patterns used per lookup or per file, compiled once
+NUMBER_PATTERN: Pattern[str] = re.compile(r"\b\d+\b")
+REVISION_NUMBER_PATTERN: Pattern[str] = re.compile(r"rev\s*(\d+)")
+AFTER_DASH_PATTERN: Pattern[str] = re.compile(r"\s*-\s*.*$")
+AFTER_COLON_PATTERN: Pattern[str] = re.compile(r"\s*:\s*.*$")
+TRAILING_DIGITS_PATTERN: Pattern[str] = re.compile(r"\s+\d+$")
+
 
-PLATFORM_MAPPING = {
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``. A
+    caller that finds the bucket empty takes a token on credit and sleeps only
+    for its own deficit, so concurrent callers queue up fairly without
+    holding the lock while waiting.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until it is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._last) * self.rate
+            )
+            self._last = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+    def penalize(self) -> None:
+        """Push the bucket into debt after the server reports rate limiting."""
+        with self._lock:
+            self._tokens = min(self._tokens - self.rate, -1.0)
+
+
+# IGDB allows 4 requests per second
+_IGDB_RATE_LIMITER = TokenBucket(rate=4.0, capacity=4.0)
+
+
+def _create_igdb_session() -> "requests.Session":
+    """
+    Create a pooled HTTP session for IGDB calls.
+
+    Connections are kept alive across lookups so the TLS handshake is paid
+    once, and transient server errors are retried by the adapter. 429s are
+    left to the caller so the shared token bucket can back off.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset({"POST"}),  # IGDB queries are read-only
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=IGDB_MAX_WORKERS,
+        pool_maxsize=IGDB_MAX_WORKERS * 2,
+        max_retries=retry,
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+_IGDB_SESSION = _create_igdb_session() if requests else None
+
+# Successful IGDB responses keyed by (endpoint, query body); a rescan of the
+# same library in one session then needs no network round-trips
+IGDB_RESPONSE_CACHE_SIZE = 50_000
+_IGDB_RESPONSE_CACHE: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+_IGDB_RESPONSE_CACHE_LOCK = threading.Lock()
+
+PLATFORM_MAPPING: Dict[str, Tuple[int, ...]] = {
     # Nintendo systems
-    ".nes": [18],
-    ".snes": [19],
-    ".smc": [19],
-    ".sfc": [19],
-    ".gb": [33],
-    ".gbc": [22],
-    ".gba": [24],
-    ".nds": [20],
-    ".3ds": [37],
-    ".cia": [37],
-    ".n64": [4],
-    ".z64": [4],
-    ".v64": [4],
-    ".ndd": [4],
-    ".gcm": [21],
-    ".gcz": [21],
-    ".rvz": [21],
-    ".wbfs": [5],  # GameCube and Wii
-    ".xci": [130],
-    ".nsp": [130],  # Nintendo Switch
-    ".vb": [87],
-    ".lnx": [28],
-    ".ngp": [119],
-    ".ngc": [120],
+    ".nes": (18,),
+    ".snes": (19,),
+    ".smc": (19,),
+    ".sfc": (19,),
+    ".gb": (33,),
+    ".gbc": (22,),
+    ".gba": (24,),
+    ".nds": (20,),
+    ".3ds": (37,),
+    ".cia": (37,),
+    ".n64": (4,),
+    ".z64": (4,),
+    ".v64": (4,),
+    ".ndd": (4,),
+    ".gcm": (21,),
+    ".gcz": (21,),
+    ".rvz": (21,),
+    ".wbfs": (5,),  # GameCube and Wii
+    ".xci": (130,),
+    ".nsp": (130,),  # Nintendo Switch
+    ".vb": (87,),
+    ".lnx": (28,),
+    ".ngp": (119,),
+    ".ngc": (120,),
     # Sega systems
-    ".md": [29],
-    ".gen": [29],
-    ".smd": [29],
-    ".gg": [35],
-    ".sms": [64],
-    ".32x": [30],
-    ".sat": [32],
-    ".gdi": [23],  # Saturn and Dreamcast
+    ".md": (29,),
+    ".gen": (29,),
+    ".smd": (29,),
+    ".gg": (35,),
+    ".sms": (64,),
+    ".32x": (30,),
+    ".sat": (32,),
+    ".gdi": (23,),  # Saturn and Dreamcast
     # Sony systems
-    ".iso": [7, 8, 9],
-    ".bin": [7, 8, 9],
-    ".cue": [7, 8, 9],
-    ".chd": [7, 8, 9],
-    ".pbp": [8],
-    ".cso": [8],
-    ".ciso": [8],  # PlayStation systems
-    ".mdf": [8],
-    ".nrg": [8],
+    ".iso": (7, 8, 9),
+    ".bin": (7, 8, 9),
+    ".cue": (7, 8, 9),
+    ".chd": (7, 8, 9),
+    ".pbp": (8,),
+    ".cso": (8,),
+    ".ciso": (8,),  # PlayStation systems
+    ".mdf": (8,),
+    ".nrg": (8,),
     # PC Engine/TurboGrafx
-    ".pce": [86],
-    ".sgx": [86],
+    ".pce": (86,),
+    ".sgx": (86,),
     # Atari systems
-    ".a26": [59],
-    ".a78": [60],
-    ".st": [63],
+    ".a26": (59,),
+    ".a78": (60,),
+    ".st": (63,),
     # Other systems
-    ".col": [68],
-    ".int": [67],
-    ".vec": [70],
-    ".ws": [57],
-    ".wsc": [57],
+    ".col": (68,),
+    ".int": (67,),
+    ".vec": (70,),
+    ".ws": (57,),
+    ".wsc": (57,),
+}
+
+# IGDB where-clause per extension, formatted once instead of on every query
+PLATFORM_WHERE_CLAUSES: Dict[str, str] = {
+    ext: f"where platforms = ({','.join(map(str, platforms))});"
+    for ext, platforms in PLATFORM_MAPPING.items()
 }
 
 
 def load_game_cache() -> None:
-    """Load game database cache from file."""
-    global GAME_CACHE
+    """Load game database cache from file, dropping entries older than the TTL.
+
+    Entries are stored on disk under ``"name|ext"`` keys as
+    ``{"name": canonical, "ts": epoch}``. Files written by older versions use
+    ``"name_ext"`` keys and bare names; those are kept and stamped with the
+    load time.
+    """
+    global GAME_CACHE, _GAME_CACHE_TIMESTAMPS
+    GAME_CACHE = {}
+    _GAME_CACHE_TIMESTAMPS = {}
     if not CACHE_FILE.exists():
-        GAME_CACHE = {}
         return
 
     try:
-        with open(CACHE_FILE, "r", encoding="utf-8") as f:
-            loaded_cache = json.load(f)
+        if orjson:
+            loaded_cache = orjson.loads(CACHE_FILE.read_bytes())
+        else:
+            with open(CACHE_FILE, "r", encoding="utf-8") as f:
+                loaded_cache = json.load(f)
         if not isinstance(loaded_cache, dict):
             logger.warning(
                 "Cache file contains invalid data format, initializing empty cache"
             )
             GAME_CACHE = {}
             return
-        GAME_CACHE = loaded_cache
+
+        now = int(time.time())
+        cutoff = now - CACHE_TTL_SECONDS
+        for key, entry in loaded_cache.items():
+            if isinstance(entry, str):
+                name, ts = entry, now
+            elif (
+                isinstance(entry, dict)
+                and isinstance(entry.get("name"), str)
+                and isinstance(entry.get("ts"), (int, float))
+            ):
+                name, ts = entry["name"], int(entry["ts"])
+            else:
+                continue
+            if ts >= cutoff:
+                game, _, ext = key.rpartition("|" if "|" in key else "_")
+                GAME_CACHE[(game, ext)] = name
+                _GAME_CACHE_TIMESTAMPS[(game, ext)] = ts
         logger.info(f"Loaded {len(GAME_CACHE)} games from cache")
     except json.JSONDecodeError as e:
         logger.error(f"Cache file contains invalid JSON: {e}")
@@ -215,9 +362,22 @@ def save_game_cache() -> None:
         CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
 
         # Write to temporary file first for atomic operation
+        now = int(time.time())
+        entries = {
+            f"{key[0]}|{key[1]}": {
+                "name": name,
+                "ts": _GAME_CACHE_TIMESTAMPS.get(key, now),
+            }
+            for key, name in GAME_CACHE.items()
+        }
         temp_file = CACHE_FILE.with_suffix(".tmp")
-        with open(temp_file, "w", encoding="utf-8") as f:
-            json.dump(GAME_CACHE, f, ensure_ascii=False, indent=2)
+        if orjson:
+            temp_file.write_bytes(orjson.dumps(entries, option=orjson.OPT_INDENT_2))
+        else:
+            # Compact output: the pure-Python indenting encoder is much slower
+            temp_file.write_text(
+                json.dumps(entries, ensure_ascii=False), encoding="utf-8"
+            )
         # Atomic rename
         temp_file.replace(CACHE_FILE)
         logger.debug(f"Saved {len(GAME_CACHE)} games to cache")
@@ -234,13 +394,11 @@ def _generate_search_variants(game_name: str) -> List[str]:
     variants = [game_name]
 
     # Create a simplified version (remove subtitles, version numbers, etc.)
-    simplified = re.sub(
-        r"\s*-\s*.*$", "", game_name
-    )  # Remove everything after first dash
-    simplified = re.sub(
-        r"\s*:\s*.*$", "", simplified
-    )  # Remove everything after first colon
-    simplified = re.sub(r"\s+\d+$", "", simplified)  # Remove trailing numbers
+    # Remove everything after first dash
+    simplified = AFTER_DASH_PATTERN.sub("", game_name)
+    # Remove everything after first colon
+    simplified = AFTER_COLON_PATTERN.sub("", simplified)
+    simplified = TRAILING_DIGITS_PATTERN.sub("", simplified)  # Remove trailing numbers
     simplified = simplified.strip()
 
     if simplified != game_name and len(simplified) > 3:
@@ -259,23 +417,325 @@ def _generate_search_variants(game_name: str) -> List[str]:
     return list(set(variants))  # Remove duplicates
 
 
+def _igdb_platform_filter(file_extension: Optional[str]) -> Tuple[str, Tuple[int, ...]]:
+    """Return the IGDB where-clause and target platform ids for an extension."""
+    ext = file_extension.lower() if file_extension else None
+    if ext not in PLATFORM_MAPPING:
+        return "", ()
+    return PLATFORM_WHERE_CLAUSES[ext], PLATFORM_MAPPING[ext]
+
+
+def _igdb_games_query(search_term: str, platform_filter: str) -> str:
+    """Build the body of an IGDB games search query."""
+    search_term = search_term.replace('"', '\\"')
+    return (
+        f'search "{search_term}"; '
+        "fields name, alternative_names.name, alternative_names.comment, "
+        "platforms, first_release_date; "
+        f"{platform_filter} limit 50;"
+    )
+
+
+def _igdb_credentials(
+    client_id: Optional[str] = None, access_token: Optional[str] = None
+) -> Optional[Tuple[str, str]]:
+    """Resolve explicit IGDB credentials, falling back to the environment ones."""
+    client_id = client_id or IGDB_CLIENT_ID
+    access_token = access_token or IGDB_ACCESS_TOKEN
+    if not client_id or not access_token:
+        return None
+    return client_id, access_token
+
+
+def _igdb_post(
+    endpoint: str, body: str, description: str, credentials: Tuple[str, str]
+) -> Optional[Any]:
+    """
+    POST a query to an IGDB endpoint with retries on rate limiting.
+
+    Identical queries are answered from an in-memory LRU of earlier responses.
+
+    Args:
+        endpoint: IGDB endpoint name, e.g. "games" or "multiquery"
+        body: Apicalypse query body
+        description: Short label used in log messages
+        credentials: (client_id, access_token) pair
+
+    Returns:
+        Decoded JSON response, or None if the request failed
+    """
+    cache_key = (endpoint, body)
+    with _IGDB_RESPONSE_CACHE_LOCK:
+        if cache_key in _IGDB_RESPONSE_CACHE:
+            _IGDB_RESPONSE_CACHE.move_to_end(cache_key)
+            return _IGDB_RESPONSE_CACHE[cache_key]
+
+    client_id, access_token = credentials
+    headers = {
+        "Client-ID": client_id,
+        "Authorization": f"Bearer {access_token}",
+        "Content-Type": "text/plain",
+    }
+
+    backoff = 0.5
+    for attempt in range(3):
+        response = None
+        _IGDB_RATE_LIMITER.acquire()
+        try:
+            response = _IGDB_SESSION.post(
+                f"{IGDB_API_URL}/{endpoint}",
+                headers=headers,
+                data=body,
+                timeout=(3, 10),
+            )
+
+            if response.status_code == 429:
+                _IGDB_RATE_LIMITER.penalize()
+                continue
+
+            response.raise_for_status()
+            data = response.json()
+            with _IGDB_RESPONSE_CACHE_LOCK:
+                _IGDB_RESPONSE_CACHE[cache_key] = data
+                if len(_IGDB_RESPONSE_CACHE) > IGDB_RESPONSE_CACHE_SIZE:
+                    _IGDB_RESPONSE_CACHE.popitem(last=False)
+            return data
+        except requests.HTTPError as http_err:
+            logger.warning("IGDB API HTTP error for '%s': %s", description, http_err)
+            if response is not None and response.status_code in (401, 403):
+                logger.error("Authentication failed - check IGDB credentials")
+            return None
+        except requests.RequestException as req_err:
+            logger.warning("IGDB API request failed for '%s': %s", description, req_err)
+            time.sleep(backoff * (attempt + 1))
+            continue
+        except json.JSONDecodeError as json_err:
+            logger.error("Invalid JSON response from IGDB API: %s", json_err)
+            return None
+        except Exception as e:
+            logger.error(
+                "Unexpected error querying IGDB API for '%s': %s", description, e
+            )
+            return None
+    return None
+
+
+# Alternative-name comments that mark a regional or translated title
+CROSS_LANGUAGE_INDICATORS = (
+    "japanese",
+    "japan",
+    "english",
+    "us",
+    "usa",
+    "europe",
+    "eur",
+    "localized",
+    "translation",
+    "regional",
+    "international",
+)
+# Title words too common to suggest two names are the same game
+GENERIC_TITLE_WORDS = frozenset(
+    {
+        "the",
+        "and",
+        "or",
+        "of",
+        "in",
+        "on",
+        "at",
+        "to",
+        "for",
+        "with",
+        "by",
+        "collection",
+        "characters",
+        "special",
+        "edition",
+        "version",
+        "vol",
+        "volume",
+        "disc",
+        "cd",
+        "dvd",
+        "game",
+        "games",
+        "series",
+        "complete",
+        "deluxe",
+    }
+)
+# Series whose Japanese and Western titles share no words
+REGIONAL_TITLE_WORDS = ("biohazard", "rockman", "street fighter")
+
+
+def _score_igdb_games(
+    game_name: str,
+    games: List[Dict[str, Any]],
+    target_platforms: Tuple[int, ...],
+    search_term: str,
+) -> Optional[Dict[str, Any]]:
+    """
+    Pick the best IGDB game for a ROM name from one search result list.
+
+    Args:
+        game_name: Original ROM base name
+        games: Game objects returned by IGDB
+        target_platforms: Platform ids that earn a bonus when matched
+        search_term: Search variant that produced these results
+
+    Returns:
+        Result dict in the query_igdb_game format, or None if nothing matched
+    """
+    scored_matches = []
+
+    # Score every main and alternative name in one batch call
+    candidate_names = [game["name"].lower() for game in games]
+    for game in games:
+        candidate_names.extend(
+            alt["name"].lower() for alt in game.get("alternative_names", ())
+        )
+    ratios = iter(name_similarities(game_name.lower(), candidate_names))
+    main_ratios = [next(ratios) for _ in games]
+
+    # Filtered once per call; compared against each loosely matching alt name
+    meaningful_game_words = set(game_name.lower().split()) - GENERIC_TITLE_WORDS
+
+    for game, main_ratio in zip(games, main_ratios):
+        all_names = [game["name"]]
+        alt_names_with_comments = []
+
+        if "alternative_names" in game:
+            for alt in game["alternative_names"]:
+                alt_name = alt["name"]
+                alt_comment = alt.get("comment", "")
+                all_names.append(alt_name)
+                alt_names_with_comments.append((alt_name, alt_comment))
+
+        platform_bonus = 0
+        if target_platforms and "platforms" in game:
+            if any(p in target_platforms for p in game["platforms"]):
+                platform_bonus = 0.2
+
+        # Check all names for matches with enhanced cross-language logic
+        best_match_score = 0
+        best_match_name = None
+        match_type = None
+        is_cross_language = False
+
+        for i, name in enumerate(all_names):
+            # Similarity against the original game_name, not search_term
+            ratio = main_ratio if i == 0 else next(ratios)
+
+            # Enhanced cross-language detection
+            cross_lang_bonus = 0
+
+            # Check if this might be a cross-language match
+            if i > 0:  # Alternative name
+                alt_comment = (
+                    alt_names_with_comments[i - 1][1].lower()
+                    if i - 1 < len(alt_names_with_comments)
+                    else ""
+                )
+
+                # Look for indicators of regional/language variants
+                if any(
+                    indicator in alt_comment for indicator in CROSS_LANGUAGE_INDICATORS
+                ):
+                    cross_lang_bonus = 0.3
+                    is_cross_language = True
+                    print(
+                        f"CONSOLE: Cross-language indicator found: '{alt_comment}' for '{name}'"
+                    )
+
+                # Also check for very different but related names (potential cross-language)
+                # Different but not completely unrelated
+                if ratio < 0.4 and ratio > 0.1:
+                    # Look for common patterns indicating same game with different name
+                    meaningful_name_words = (
+                        set(name.lower().split()) - GENERIC_TITLE_WORDS
+                    )
+
+                    # If they share some meaningful key words but are quite different, might be cross-language
+                    word_overlap = len(
+                        meaningful_game_words.intersection(meaningful_name_words)
+                    )
+                    if (word_overlap >= 2 and len(meaningful_game_words) >= 2) or any(
+                        word in name.lower() for word in REGIONAL_TITLE_WORDS
+                    ):
+                        cross_lang_bonus = 0.2
+                        is_cross_language = True
+                        print(
+                            f"CONSOLE: Potential cross-language match: "
+                            f"'{game_name}' vs '{name}' (ratio: {ratio:.2f})"
+                        )
+
+            # Different thresholds based on match type and cross-language potential
+            if name == game["name"]:  # Main name
+                threshold = 0.65  # More lenient for main names
+                if ratio >= threshold:
+                    final_score = ratio + platform_bonus + cross_lang_bonus
+                    if final_score > best_match_score:
+                        best_match_score = final_score
+                        best_match_name = name
+                        match_type = "main"
+            else:  # Alternative name - much more lenient for cross-language
+                threshold = 0.2 if cross_lang_bonus > 0 else 0.3
+                if ratio >= threshold:
+                    final_score = ratio + platform_bonus + cross_lang_bonus
+                    if final_score > best_match_score:
+                        best_match_score = final_score
+                        best_match_name = name
+                        match_type = "alternative"
+
+        if best_match_score > 0:
+            scored_matches.append(
+                {
+                    "game": game,
+                    "score": best_match_score,
+                    "match_name": best_match_name,
+                    "match_type": match_type,
+                    "all_names": all_names,
+                    "is_cross_language": is_cross_language,
+                }
+            )
+
+    if not scored_matches:
+        return None
+
+    best = max(scored_matches, key=lambda x: x["score"])
+    return {
+        "canonical_name": best["game"]["name"],
+        "alternative_names": best["all_names"],
+        "id": best["game"]["id"],
+        "match_score": best["score"],
+        "matched_on": best["match_name"],
+        "is_cross_language": best["is_cross_language"],
+        "search_term_used": search_term,
+    }
+
+
 def query_igdb_game(
-    game_name: str, file_extension: Optional[str] = None
+    game_name: str,
+    file_extension: Optional[str] = None,
+    client_id: Optional[str] = None,
+    access_token: Optional[str] = None,
 ) -> Optional[Dict[str, Any]]:
-    """Query IGDB for game information and alternative names with enhanced cross-language matching."""
+    """Query IGDB for game information and alternative names with enhanced cross-language matching.
+
+    Credentials default to the IGDB_CLIENT_ID/IGDB_ACCESS_TOKEN environment
+    values when not passed explicitly.
+    """
     if not requests:
         logger.debug("requests library not available - skipping IGDB lookup")
         return None
 
-    if not IGDB_CLIENT_ID or not IGDB_ACCESS_TOKEN:
+    credentials = _igdb_credentials(client_id, access_token)
+    if not credentials:
         logger.debug("IGDB credentials not configured - skipping API lookup")
         return None
 
-    platform_filter = ""
-    target_platforms = []
-    if file_extension and file_extension.lower() in PLATFORM_MAPPING:
-        target_platforms = PLATFORM_MAPPING[file_extension.lower()]
-        platform_filter = f"where platforms = ({','.join(map(str, target_platforms))});"
+    platform_filter, target_platforms = _igdb_platform_filter(file_extension)
 
     # Try multiple search variants for better cross-language matching
     search_variants = _generate_search_variants(game_name)
@@ -289,245 +749,27 @@ def query_igdb_game(
             )
 
         # Enhanced query to get more comprehensive alternative names
-        query = f"""
-        search "{search_term}";
-        fields name, alternative_names.name, alternative_names.comment, platforms, first_release_date;
-        {platform_filter}
-        limit 50;
-        """
-
-        headers = {
-            "Client-ID": IGDB_CLIENT_ID,
-            "Authorization": f"Bearer {IGDB_ACCESS_TOKEN}",
-            "Content-Type": "text/plain",
-        }
-
-        backoff = 0.5
-        for attempt in range(3):
-            try:
-                response = requests.post(
-                    "https://api.igdb.com/v4/games",
-                    headers=headers,
-                    data=query.strip(),
-                    timeout=10,
-                )
-
-                if response.status_code == 429:
-                    time.sleep(backoff * (attempt + 1))
-                    continue
+        games = _igdb_post(
+            "games",
+            _igdb_games_query(search_term, platform_filter),
+            search_term,
+            credentials,
+        )
+        if not games:
+            continue
 
-                response.raise_for_status()
-                games = response.json()
-
-                scored_matches = []
-
-                for game in games:
-                    all_names = [game["name"]]
-                    alt_names_with_comments = []
-
-                    if "alternative_names" in game:
-                        for alt in game["alternative_names"]:
-                            alt_name = alt["name"]
-                            alt_comment = alt.get("comment", "")
-                            all_names.append(alt_name)
-                            alt_names_with_comments.append((alt_name, alt_comment))
-
-                    platform_bonus = 0
-                    if target_platforms and "platforms" in game:
-                        game_platforms = [p for p in game["platforms"]]
-                        if any(p in target_platforms for p in game_platforms):
-                            platform_bonus = 0.2
-
-                    # Check all names for matches with enhanced cross-language logic
-                    best_match_score = 0
-                    best_match_name = None
-                    match_type = None
-                    is_cross_language = False
-
-                    for i, name in enumerate(all_names):
-                        # Calculate basic similarity (compare with original game_name, not search_term)
-                        ratio = SequenceMatcher(
-                            None, game_name.lower(), name.lower()
-                        ).ratio()
-
-                        # Enhanced cross-language detection
-                        cross_lang_bonus = 0
-
-                        # Check if this might be a cross-language match
-                        if i > 0:  # Alternative name
-                            alt_comment = (
-                                alt_names_with_comments[i - 1][1].lower()
-                                if i - 1 < len(alt_names_with_comments)
-                                else ""
-                            )
-
-                            # Look for indicators of regional/language variants
-                            cross_lang_indicators = [
-                                "japanese",
-                                "japan",
-                                "english",
-                                "us",
-                                "usa",
-                                "europe",
-                                "eur",
-                                "localized",
-                                "translation",
-                                "regional",
-                                "international",
-                            ]
-
-                            if any(
-                                indicator in alt_comment
-                                for indicator in cross_lang_indicators
-                            ):
-                                cross_lang_bonus = 0.3
-                                is_cross_language = True
-                                print(
-                                    f"CONSOLE: Cross-language indicator found: '{alt_comment}' for '{name}'"
-                                )
-
-                            # Also check for very different but related names (potential cross-language)
-                            if (
-                                ratio < 0.4 and ratio > 0.1
-                            ):  # Different but not completely unrelated
-                                # Look for common patterns indicating same game with different name
-                                game_words = set(game_name.lower().split())
-                                name_words = set(name.lower().split())
-
-                                # Filter out common generic words that cause false positives
-                                generic_words = {
-                                    "the",
-                                    "and",
-                                    "or",
-                                    "of",
-                                    "in",
-                                    "on",
-                                    "at",
-                                    "to",
-                                    "for",
-                                    "with",
-                                    "by",
-                                    "collection",
-                                    "characters",
-                                    "special",
-                                    "edition",
-                                    "version",
-                                    "vol",
-                                    "volume",
-                                    "disc",
-                                    "cd",
-                                    "dvd",
-                                    "game",
-                                    "games",
-                                    "series",
-                                    "complete",
-                                    "deluxe",
-                                }
-                                meaningful_game_words = game_words - generic_words
-                                meaningful_name_words = name_words - generic_words
-
-                                # If they share some meaningful key words but are quite different, might be cross-language
-                                word_overlap = len(
-                                    meaningful_game_words.intersection(
-                                        meaningful_name_words
-                                    )
-                                )
-                                if (
-                                    word_overlap >= 2
-                                    and len(meaningful_game_words) >= 2
-                                ) or any(
-                                    word in name.lower()
-                                    for word in [
-                                        "biohazard",
-                                        "rockman",
-                                        "street fighter",
-                                    ]
-                                ):
-                                    cross_lang_bonus = 0.2
-                                    is_cross_language = True
-                                    print(
-                                        f"CONSOLE: Potential cross-language match: "
-                                        f"'{game_name}' vs '{name}' (ratio: {ratio:.2f})"
-                                    )
-
-                        # Different thresholds based on match type and cross-language potential
-                        if name == game["name"]:  # Main name
-                            threshold = 0.65  # More lenient for main names
-                            if ratio >= threshold:
-                                final_score = ratio + platform_bonus + cross_lang_bonus
-                                if final_score > best_match_score:
-                                    best_match_score = final_score
-                                    best_match_name = name
-                                    match_type = "main"
-                        else:  # Alternative name - much more lenient for cross-language
-                            threshold = 0.2 if cross_lang_bonus > 0 else 0.3
-                            if ratio >= threshold:
-                                final_score = ratio + platform_bonus + cross_lang_bonus
-                                if final_score > best_match_score:
-                                    best_match_score = final_score
-                                    best_match_name = name
-                                    match_type = "alternative"
-
-                    if best_match_score > 0:
-                        scored_matches.append(
-                            {
-                                "game": game,
-                                "score": best_match_score,
-                                "match_name": best_match_name,
-                                "match_type": match_type,
-                                "all_names": all_names,
-                                "is_cross_language": is_cross_language,
-                                "search_term": search_term,
-                            }
-                        )
+        try:
+            current_best = _score_igdb_games(
+                game_name, games, target_platforms, search_term
+            )
+        except (KeyError, TypeError) as data_err:
+            logger.error("Unexpected data structure from IGDB API: %s", data_err)
+            continue
 
-                # Keep track of best result across all search terms
-                if scored_matches:
-                    scored_matches.sort(key=lambda x: x["score"], reverse=True)
-                    current_best = scored_matches[0]
-
-                    if current_best["score"] > best_score:
-                        best_score = current_best["score"]
-                        best_result = {
-                            "canonical_name": current_best["game"]["name"],
-                            "alternative_names": current_best["all_names"],
-                            "id": current_best["game"]["id"],
-                            "match_score": current_best["score"],
-                            "matched_on": current_best["match_name"],
-                            "is_cross_language": current_best.get(
-                                "is_cross_language", False
-                            ),
-                            "search_term_used": current_best["search_term"],
-                        }
-
-                break
-            except requests.HTTPError as http_err:
-                logger.warning(
-                    "IGDB API HTTP error for '%s': %s", search_term, http_err
-                )
-                if response.status_code in (401, 403):
-                    logger.error("Authentication failed - check IGDB credentials")
-                break
-            except requests.RequestException as req_err:
-                logger.warning(
-                    "IGDB API request failed for '%s': %s", search_term, req_err
-                )
-                time.sleep(backoff * (attempt + 1))
-                continue
-            except json.JSONDecodeError as json_err:
-                logger.error("Invalid JSON response from IGDB API: %s", json_err)
-                break
-            except (KeyError, TypeError) as data_err:
-                logger.error("Unexpected data structure from IGDB API: %s", data_err)
-                break
-            except Exception as e:
-                logger.error(
-                    "Unexpected error querying IGDB API for '%s': %s", search_term, e
-                )
-                break
-            finally:
-                # Rate limiting
-                time.sleep(0.25)  # IGDB allows 4 requests per second
+        # Keep track of best result across all search terms
+        if current_best and current_best["match_score"] > best_score:
+            best_score = current_best["match_score"]
+            best_result = current_best
 
     # Log cross-language matches for debugging
     if best_result and best_result.get("is_cross_language", False):
@@ -538,6 +780,80 @@ def query_igdb_game(
     return best_result
 
 
+def query_igdb_games_batch(
+    games: List[Tuple[str, Optional[str]]],
+    client_id: Optional[str] = None,
+    access_token: Optional[str] = None,
+) -> Dict[Tuple[str, Optional[str]], Optional[Dict[str, Any]]]:
+    """
+    Look up many games with IGDB's multiquery endpoint.
+
+    Names are sent IGDB_MULTIQUERY_LIMIT at a time as named sub-queries, so N
+    games cost ceil(N / 10) requests instead of N. Only the name itself is
+    searched; callers fall back to query_igdb_game (which also tries search
+    variants) for names that come back without a match.
+
+    Args:
+        games: List of (game_name, file_extension) pairs
+        client_id: IGDB client id (defaults to IGDB_CLIENT_ID)
+        access_token: IGDB access token (defaults to IGDB_ACCESS_TOKEN)
+
+    Returns:
+        Dictionary mapping each pair to its query_igdb_game-style result or None
+    """
+    results: Dict[Tuple[str, Optional[str]], Optional[Dict[str, Any]]] = {}
+    credentials = _igdb_credentials(client_id, access_token)
+    if not requests or not credentials:
+        return results
+
+    pending = list(dict.fromkeys(games))
+    chunks = [
+        pending[start : start + IGDB_MULTIQUERY_LIMIT]
+        for start in range(0, len(pending), IGDB_MULTIQUERY_LIMIT)
+    ]
+
+    # Requests overlap on the network while the shared token bucket keeps the
+    # combined rate within IGDB's limit
+    with ThreadPoolExecutor(max_workers=IGDB_MAX_WORKERS) as executor:
+        for chunk_results in executor.map(
+            _query_igdb_chunk, chunks, [credentials] * len(chunks)
+        ):
+            results.update(chunk_results)
+
+    return results
+
+
+def _query_igdb_chunk(
+    chunk: List[Tuple[str, Optional[str]]], credentials: Tuple[str, str]
+) -> Dict[Tuple[str, Optional[str]], Optional[Dict[str, Any]]]:
+    """Send one multiquery request for up to IGDB_MULTIQUERY_LIMIT games."""
+    results: Dict[Tuple[str, Optional[str]], Optional[Dict[str, Any]]] = {}
+    filters = [_igdb_platform_filter(ext) for _, ext in chunk]
+    body = "\n".join(
+        f'query games "q{i}" {{ {_igdb_games_query(name, platform_filter)} }};'
+        for i, ((name, _), (platform_filter, _)) in enumerate(zip(chunk, filters))
+    )
+
+    response = _igdb_post("multiquery", body, f"batch of {len(chunk)}", credentials)
+    if not isinstance(response, list):
+        return results
+
+    for sub_result in response:
+        try:
+            index = int(sub_result["name"][1:])
+            game_name, _ = chunk[index]
+            results[chunk[index]] = _score_igdb_games(
+                game_name,
+                sub_result.get("result", []),
+                filters[index][1],
+                game_name,
+            )
+        except (KeyError, TypeError, ValueError, IndexError) as data_err:
+            logger.error("Unexpected data structure from IGDB API: %s", data_err)
+
+    return results
+
+
 def normalize_canonical_name(name: str) -> str:
     """
     Basic normalization - just lowercase and strip.
@@ -546,19 +862,61 @@ def normalize_canonical_name(name: str) -> str:
     return name.lower().strip()
 
 
-def get_canonical_name(game_name: str, file_extension: Optional[str] = None) -> str:
+def _cache_key(game_name: str, file_extension: Optional[str] = None) -> Tuple[str, str]:
+    """Return the GAME_CACHE key for a game name and file extension."""
+    return game_name.strip().lower(), file_extension or "unknown"
+
+
+def prefetch_canonical_names(
+    games: List[Tuple[str, Optional[str]]],
+    client_id: Optional[str] = None,
+    access_token: Optional[str] = None,
+) -> None:
+    """
+    Resolve uncached games through batched IGDB queries and cache the hits.
+
+    Games without a batch match are left uncached so get_canonical_name still
+    runs its full search-variant lookup and fuzzy fallback for them.
+
+    Args:
+        games: List of (game_name, file_extension) pairs
+        client_id: IGDB client id (defaults to IGDB_CLIENT_ID)
+        access_token: IGDB access token (defaults to IGDB_ACCESS_TOKEN)
+    """
+    uncached = [
+        (name, ext) for name, ext in games if _cache_key(name, ext) not in GAME_CACHE
+    ]
+    if not uncached:
+        return
+
+    batch = query_igdb_games_batch(uncached, client_id, access_token)
+    for (name, ext), result in batch.items():
+        if result:
+            GAME_CACHE[_cache_key(name, ext)] = normalize_canonical_name(
+                result["canonical_name"]
+            )
+
+
+def get_canonical_name(
+    game_name: str,
+    file_extension: Optional[str] = None,
+    client_id: Optional[str] = None,
+    access_token: Optional[str] = None,
+) -> str:
     """
     Get canonical name for a game using database lookup and fuzzy matching.
+
+    IGDB credentials default to the environment values when not passed.
     """
     game_name_clean = game_name.strip().lower()
 
     # Check cache first
-    cache_key = f"{game_name_clean}_{file_extension or 'unknown'}"
+    cache_key = _cache_key(game_name, file_extension)
     if cache_key in GAME_CACHE:
         return GAME_CACHE[cache_key]
 
     # Try IGDB API lookup
-    igdb_result = query_igdb_game(game_name, file_extension)
+    igdb_result = query_igdb_game(game_name, file_extension, client_id, access_token)
     if igdb_result:
         canonical = normalize_canonical_name(igdb_result["canonical_name"])
         GAME_CACHE[cache_key] = canonical
@@ -568,21 +926,27 @@ def get_canonical_name(game_name: str, file_extension: Optional[str] = None) ->
     best_match = None
     best_ratio = 0.0
 
+    game_numbers = NUMBER_PATTERN.findall(game_name)
+    candidate_names = []
+    candidate_canonicals = []
+
     for cached_key, cached_canonical in GAME_CACHE.items():
-        if file_extension and not cached_key.endswith(file_extension or "unknown"):
+        if file_extension and cached_key[1] != file_extension:
             continue
 
-        cached_name = cached_key.split("_")[0]  # Remove file extension part
-        ratio = SequenceMatcher(None, game_name_clean, cached_name).ratio()
-
         # Check if this would be incorrectly matching numbered sequels
-        game_numbers = re.findall(r"\b\d+\b", game_name)
-        cached_numbers = re.findall(r"\b\d+\b", cached_canonical)
+        cached_numbers = NUMBER_PATTERN.findall(cached_canonical)
 
         # Don't match if they have different numbers (prevents sequel confusion)
         if game_numbers != cached_numbers and (game_numbers or cached_numbers):
             continue
 
+        candidate_names.append(cached_key[0])
+        candidate_canonicals.append(cached_canonical)
+
+    # Score all surviving candidates in one batch call
+    ratios = name_similarities(game_name_clean, candidate_names)
+    for ratio, cached_canonical in zip(ratios, candidate_canonicals):
         # More lenient threshold for cross-language matching
         if ratio > best_ratio and ratio > 0.75:  # Lowered from 0.85
             best_ratio = ratio
@@ -638,39 +1002,135 @@ def scan_roms(
 
     logger.info("Processing ROM files...")
 
-    for file_path in directory.rglob("*"):
-        if "to_delete" in file_path.parts:
-            continue
-        if file_path.is_file() and file_path.suffix.lower() in rom_extensions:
-            filename = file_path.name
-            base_name = get_base_name(filename)
-            file_extension = file_path.suffix.lower()
+    entries = list(iter_rom_files(directory, rom_extensions))
+    parsed = parse_rom_filenames([entry.name for entry in entries])
+
+    # The walker only yields names with a non-leading dot
+    extensions = [entry.name[entry.name.rfind(".") :].lower() for entry in entries]
+    prefetch_canonical_names(
+        list(
+            dict.fromkeys(
+                (base_name, ext) for (base_name, _), ext in zip(parsed, extensions)
+            )
+        )
+    )
+
+    # Regional variants share a base name, so resolve each pair only once
+    local_canon: Dict[Tuple[str, str], str] = {}
+
+    for entry, (base_name, region), file_extension in zip(entries, parsed, extensions):
+        key = (base_name, file_extension)
+        canonical_name = local_canon.get(key)
+        if canonical_name is None:
             canonical_name = get_canonical_name(base_name, file_extension)
-            region = get_region(filename)
+            local_canon[key] = canonical_name
 
-            rom_groups[canonical_name].append((file_path, region, base_name))
+        rom_groups[canonical_name].append((Path(entry.path), region, base_name))
 
-            processed_files += 1
-            if processed_files % 10 == 0:
-                logger.debug("  Processed %d files...", processed_files)
+        processed_files += 1
+        if processed_files % 10 == 0:
+            logger.debug("  Processed %d files...", processed_files)
 
     logger.info("Processed %d ROM files in total.", processed_files)
 
     save_game_cache()
 
-    # Debug output: show game groupings
-    logger.debug("\nGame groupings after processing:")
-    for canonical_name, roms in rom_groups.items():
-        if len(roms) > 1:
-            logger.debug("  🎮 %s:", canonical_name)
-            for file_path, region, original_name in roms:
-                logger.debug(
-                    "    - %s (%s) -> %s", original_name, region, file_path.name
-                )
+    # Debug output: show game groupings (skip the walk unless it will be logged)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("\nGame groupings after processing:")
+        for canonical_name, roms in rom_groups.items():
+            if len(roms) > 1:
+                logger.debug("  🎮 %s:", canonical_name)
+                for file_path, region, original_name in roms:
+                    logger.debug(
+                        "    - %s (%s) -> %s", original_name, region, file_path.name
+                    )
 
     return rom_groups
 
 
+def _max_pair_similarity(
+    names_a: Set[str], names_b: Set[str], threshold: float = 1.0
+) -> float:
+    """
+    Return the best similarity ratio between any pair drawn from two name sets.
+
+    Identical names are collapsed by the caller passing sets, and the search
+    stops as soon as a pair reaches ``threshold`` since callers only care
+    whether the threshold is met. RapidFuzz is used when installed, with the
+    same fallback to SequenceMatcher as ``name_similarities``.
+
+    Args:
+        names_a: Lowercased names from the first region
+        names_b: Lowercased names from the second region
+        threshold: Ratio at which the search can stop early
+
+    Returns:
+        Highest ratio found (at least ``threshold`` if the search stopped early)
+    """
+    if names_a & names_b:
+        return 1.0
+
+    max_ratio = 0.0
+    if process is not None:
+        # Score each name against the whole other set in compiled code
+        choices = list(names_a)
+        for name_b in names_b:
+            match = process.extractOne(name_b, choices, scorer=fuzz.ratio)
+            if match and match[1] / 100.0 > max_ratio:
+                max_ratio = match[1] / 100.0
+                if max_ratio >= threshold:
+                    return max_ratio
+        return max_ratio
+
+    matcher = SequenceMatcher(None)
+    for name_b in names_b:
+        # SequenceMatcher caches analysis of the second sequence
+        matcher.set_seq2(name_b)
+        for name_a in names_a:
+            matcher.set_seq1(name_a)
+            if matcher.real_quick_ratio() <= max_ratio:
+                continue
+            ratio = matcher.ratio()
+            if ratio > max_ratio:
+                max_ratio = ratio
+                if max_ratio >= threshold:
+                    return max_ratio
+    return max_ratio
+
+
+# Same-region variant preferences used by find_duplicates_to_remove
+FORMAT_PRIORITY: Dict[str, int] = {".zip": 3, ".cue": 2, ".bin": 1}
+SPECIAL_EDITION_KEYWORDS = ("limited", "premium", "special", "genteiban", "shokai")
+DEV_VERSION_KEYWORDS = ("beta", "proto", "demo", "sample", "taikenban")
+
+
+def _same_region_priority(file_tuple: Tuple[Path, str]) -> Tuple[int, int, int]:
+    """
+    Rank a same-region variant; higher tuples are preferred.
+
+    Priority is file format (.zip > .cue > .bin), then edition (standard >
+    limited/premium/special > beta/proto/demo), then revision number.
+    """
+    file_path, _ = file_tuple
+    filename = file_path.name.lower()
+
+    format_priority = FORMAT_PRIORITY.get(os.path.splitext(filename)[1], 0)
+
+    # Development versions rank below special editions, which rank below standard
+    if any(keyword in filename for keyword in DEV_VERSION_KEYWORDS):
+        edition_priority = 1
+    elif any(keyword in filename for keyword in SPECIAL_EDITION_KEYWORDS):
+        edition_priority = 2
+    else:
+        edition_priority = 3
+
+    rev_match = REVISION_NUMBER_PATTERN.search(filename)
+    rev_priority = int(rev_match.group(1)) if rev_match else 0
+
+    return (format_priority, edition_priority, rev_priority)
+
+
 def find_duplicates_to_remove(
     rom_groups: Dict[str, List[Tuple[Path, str, str]]],
     log_func: Optional[Callable[[str], None]] = None,
@@ -731,14 +1191,11 @@ def find_duplicates_to_remove(
         # Case 1: USA and Japan both exist - remove Japan
         if "usa" in regions and "japan" in regions:
             # Verify similarity for safety
-            max_ratio = 0.0
-            for _, j_name in regions["japan"]:
-                for _, u_name in regions["usa"]:
-                    ratio = SequenceMatcher(
-                        None, j_name.lower(), u_name.lower()
-                    ).ratio()
-                    if ratio > max_ratio:
-                        max_ratio = ratio
+            max_ratio = _max_pair_similarity(
+                {name.lower() for _, name in regions["japan"]},
+                {name.lower() for _, name in regions["usa"]},
+                threshold=0.6,
+            )
 
             # Only remove if they seem to be the same game
             if len(original_names) > 1 and max_ratio < 0.6:
@@ -808,61 +1265,9 @@ def find_duplicates_to_remove(
                 # Multiple files in same region - apply preferences
                 log(f"  📋 Found {len(files)} same-region variants in {region}")
 
-                # Sort by preferences: file format, then edition, then revision
-                def get_file_priority(file_tuple):
-                    file_path, original_name = file_tuple
-                    filename = file_path.name.lower()
-
-                    # Priority 1: File format (.zip preferred over .cue/.bin)
-                    format_priority = 0
-                    if filename.endswith(".zip"):
-                        format_priority = 3
-                    elif filename.endswith(".cue"):
-                        format_priority = 2
-                    elif filename.endswith(".bin"):
-                        format_priority = 1
-                    else:
-                        format_priority = 0
-
-                    # Priority 2: Edition (standard > limited/premium/special > beta/proto/demo)
-                    edition_priority = 3  # Standard release
-
-                    # Check for special/limited editions (lower priority than standard)
-                    special_keywords = [
-                        "limited",
-                        "premium",
-                        "special",
-                        "genteiban",
-                        "shokai",
-                    ]
-                    if any(keyword in filename for keyword in special_keywords):
-                        edition_priority = 2
-
-                    # Check for development versions (lowest priority)
-                    dev_keywords = [
-                        "beta",
-                        "proto",
-                        "demo",
-                        "sample",
-                        "taikenban",
-                    ]
-                    if any(keyword in filename for keyword in dev_keywords):
-                        edition_priority = 1
-
-                    # Priority 3: Revision (higher rev numbers preferred)
-                    rev_priority = 0
-                    rev_match = re.search(r"rev\s*(\d+)", filename)
-                    if rev_match:
-                        rev_priority = int(rev_match.group(1))
-
-                    return (format_priority, edition_priority, rev_priority)
-
-                # Sort files by priority (highest priority first)
-                sorted_files = sorted(files, key=get_file_priority, reverse=True)
-
                 # Keep the highest priority file, remove others
-                keep_file = sorted_files[0]
-                remove_files = sorted_files[1:]
+                keep_file = max(files, key=_same_region_priority)
+                remove_files = [f for f in files if f is not keep_file]
 
                 # Log the decision
                 keep_path, keep_original = keep_file
@@ -886,6 +1291,103 @@ def find_duplicates_to_remove(
     return to_remove
 
 
+# Errors meaning copy_file_range cannot be used for this pair of files
+_COPY_FILE_RANGE_UNSUPPORTED = frozenset(
+    {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF}
+)
+
+
+def _copy_file_range(src_fd: int, dst_fd: int, size: int) -> bool:
+    """
+    Copy file contents in the kernel with os.copy_file_range.
+
+    On filesystems with copy-on-write support (btrfs, XFS) this becomes a
+    reflink and no data is copied at all.
+
+    Returns:
+        True if the whole file was copied, False if the call is unsupported
+
+    Raises:
+        OSError: If the copy stops part way, which would leave a truncated file
+    """
+    if not hasattr(os, "copy_file_range"):
+        return False
+
+    copied = 0
+    while copied < size:
+        try:
+            sent = os.copy_file_range(src_fd, dst_fd, size - copied)
+        except OSError as e:
+            if copied == 0 and e.errno in _COPY_FILE_RANGE_UNSUPPORTED:
+                return False
+            raise
+        if sent == 0:
+            # Some FUSE, NFS and CIFS mounts report 0 instead of an error when
+            # they cannot copy across devices
+            if copied == 0:
+                return False
+            raise OSError(
+                errno.EIO, f"copy_file_range stopped after {copied} of {size} bytes"
+            )
+        copied += sent
+    return True
+
+
+def _copy_file(src: Union[str, Path], dst: Union[str, Path]) -> None:
+    """
+    Copy a file with its metadata using the fastest available mechanism.
+
+    Tries the in-kernel os.copy_file_range first. Otherwise shutil.copyfile
+    is used, which picks sendfile on Linux, fcopyfile on macOS and a 1 MiB
+    readinto loop on Windows. File times and permissions are preserved with
+    shutil.copystat.
+    """
+    with open(src, "rb", buffering=0) as fsrc, open(dst, "wb") as fdst:
+        src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+        copied = _copy_file_range(src_fd, dst_fd, os.fstat(src_fd).st_size)
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def move_file(src: Union[str, Path], dst: Union[str, Path]) -> None:
+    """
+    Move a file, renaming it in place whenever possible.
+
+    os.replace is a metadata-only rename on the same filesystem; only a
+    cross-device move (EXDEV) falls back to copying and deleting the source.
+    """
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        _copy_file(src, dst)
+        os.unlink(src)
+
+
+def _move_one_to_safe_folder(file_path: Path, dest_path: str) -> bool:
+    """Move one ROM to its precomputed place in the safe folder.
+
+    Returns:
+        True if the file was moved; failures are logged and return False
+    """
+    try:
+        move_file(file_path, dest_path)
+        logger.info("  Moved: %s -> %s", file_path, dest_path)
+        return True
+    except PermissionError as e:
+        logger.error("  Permission denied moving %s: %s", file_path, e)
+    except FileNotFoundError as e:
+        logger.error("  File not found: %s: %s", file_path, e)
+    except OSError as e:
+        logger.error("  OS error moving %s: %s", file_path, e)
+    except Exception as e:
+        logger.error("  Unexpected error moving %s: %s", file_path, e)
+
+    return False
+
+
 def move_to_safe_folder(rom_directory: Union[str, Path], to_remove: List[Path]) -> int:
     """
     Move ROMs to a 'to_delete' subfolder for safe review before deletion.
@@ -915,30 +1417,35 @@ def move_to_safe_folder(rom_directory: Union[str, Path], to_remove: List[Path])
         logger.error(f"Could not create safe folder: {e}")
         raise
 
-    moved_count = 0
+    # Mirror each file's relative path inside the safe folder. Scanned paths
+    # start with the directory string, so slicing avoids relative_to per file.
+    root_prefix = os.path.join(os.fspath(rom_dir_path), "")
+    safe_root = os.fspath(safe_folder)
+    moves = []
     for file_path in to_remove:
+        src = os.fspath(file_path)
+        if src.startswith(root_prefix):
+            rel_path = src[len(root_prefix) :]
+        else:
+            try:
+                rel_path = os.fspath(file_path.relative_to(rom_dir_path))
+            except ValueError as e:
+                logger.error("  Path error with %s: %s", file_path, e)
+                continue
+        moves.append((file_path, os.path.join(safe_root, rel_path)))
+
+    # Create each destination directory once rather than once per file
+    for directory in {os.path.dirname(dest_path) for _, dest_path in moves}:
         try:
-            # Create relative path structure in safe folder
-            rel_path = file_path.relative_to(Path(rom_directory))
-            dest_path = safe_folder / rel_path
-
-            # Create subdirectories if needed
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Move the file
-            shutil.move(str(file_path), str(dest_path))
-            logger.info("  Moved: %s -> %s", file_path, dest_path)
-            moved_count += 1
-        except PermissionError as e:
-            logger.error("  Permission denied moving %s: %s", file_path, e)
-        except FileNotFoundError as e:
-            logger.error("  File not found: %s: %s", file_path, e)
+            os.makedirs(directory, exist_ok=True)
         except OSError as e:
-            logger.error("  OS error moving %s: %s", file_path, e)
-        except ValueError as e:
-            logger.error("  Path error with %s: %s", file_path, e)
-        except Exception as e:
-            logger.error("  Unexpected error moving %s: %s", file_path, e)
+            logger.error("  Could not create %s: %s", directory, e)
+
+    # Moves are syscall-bound, so overlapping them pays off on network shares
+    with ThreadPoolExecutor(max_workers=FILE_OP_WORKERS) as executor:
+        moved_count = sum(
+            executor.map(lambda move: _move_one_to_safe_folder(*move), moves)
+        )
 
     return moved_count
 
@@ -1041,7 +1548,7 @@ def main() -> int:
         logger.error(f"Invalid directory: {e}")
         return 1
 
-    rom_extensions = set(DEFAULT_ROM_EXTENSIONS)
+    rom_extensions = DEFAULT_ROM_EXTENSIONS
 
     if args.extensions:
         custom_extensions = set()
@@ -1049,7 +1556,7 @@ def main() -> int:
             ext = ext.strip().lower()
             ext = ext if ext.startswith(".") else "." + ext
             custom_extensions.add(ext)
-        rom_extensions.update(custom_extensions)
+        rom_extensions = rom_extensions | custom_extensions
 
     logger.info("Scanning ROM files in: %s", os.path.abspath(args.directory))
     logger.info("Looking for extensions: %s", ", ".join(sorted(rom_extensions)))
@@ -1131,9 +1638,9 @@ def main() -> int:
     else:
         logger.info("\nRemoving files...")
         removed_count = 0
-        for file_path in to_remove:
+        for file_path in map(os.fspath, to_remove):
             try:
-                file_path.unlink()
+                os.unlink(file_path)
                 logger.info("  Removed: %s", file_path)
                 removed_count += 1
             except PermissionError as e:
@@ -1151,4 +1658,6 @@ def main() -> int:
 
 
 if __name__ == "__main__":
+    # Frozen builds must not rerun the CLI in parse worker processes
+    multiprocessing.freeze_support()
     sys.exit(main())
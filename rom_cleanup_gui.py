@@ -9,26 +9,39 @@ unique releases.
 
 import json
 import logging
+import multiprocessing
+import os
+import queue
+import re
 import shutil
 import threading
+import time
 import tkinter as tk
 from collections import defaultdict
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from tkinter import filedialog, messagebox, scrolledtext, ttk
-from typing import Dict
+from typing import Dict, List
 
 from credential_manager import get_credential_manager
-from rom_utils import get_base_name, get_region
+from rom_utils import (
+    clear_parse_caches,
+    iter_rom_files,
+    parse_rom_filenames,
+)
 
 # Import IGDB functionality from rom_cleanup.py
 try:
-    from rom_cleanup import query_igdb_game
+    from rom_cleanup import move_file, query_igdb_game, query_igdb_games_batch
 except ImportError:
+    move_file = shutil.move
     query_igdb_game = None
+    query_igdb_games_batch = None
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     requests = None
     print(
@@ -36,6 +49,11 @@ except ImportError:
         "Please install it to enable them."
     )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from tgdb_query import get_canonical_name, query_tgdb_game
 
 # Default public API key for TheGamesDB - works out of the box for all users
@@ -52,6 +70,40 @@ except ImportError:
 # Global variables
 GAME_CACHE = {}  # For caching game queries
 CACHE_FILE = Path("rom_game_cache.json")  # Cache file path
+CACHE_TTL_SECONDS = 30 * 24 * 60 * 60  # Re-query the API after 30 days
+_cache_load_thread = None  # Background loader started by main()
+# How often queued log lines are written to the log widget
+LOG_DRAIN_INTERVAL_MS = 100
+# Oldest lines are dropped past this so the log widget does not grow unbounded
+LOG_MAX_LINES = 5000
+# Per-file move/delete lines are queued at most this many at a time
+FILE_LOG_BATCH_SIZE = 500
+# Minimum seconds between progress bar updates (~30 Hz)
+PROGRESS_UPDATE_INTERVAL = 1 / 30
+# Smaller progress changes are not worth a redraw
+PROGRESS_MIN_STEP = 1.0
+# Concurrent file moves/deletes; overlapping I/O helps most on network shares
+FILE_OP_WORKERS = min(16, (os.cpu_count() or 1) * 4)
+# Standalone numbers, used to tell numbered sequels apart
+NUMBER_PATTERN = re.compile(r"\b\d+\b")
+
+
+def create_http_session():
+    """Create a keep-alive HTTP session for the GUI's API checks.
+
+    Reusing one session avoids a fresh TCP and TLS handshake for every
+    connection test, token request and API detail lookup.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "POST"}),
+        raise_on_status=False,
+    )
+    session.mount("https://", HTTPAdapter(max_retries=retry))
+    return session
 
 
 def query_game_api(
@@ -71,17 +123,99 @@ def query_game_api(
         and igdb_client_id
         and igdb_access_token
     ):
-        # Set global variables in rom_cleanup module before calling
-        import rom_cleanup
-
-        rom_cleanup.IGDB_CLIENT_ID = igdb_client_id
-        rom_cleanup.IGDB_ACCESS_TOKEN = igdb_access_token
-        return query_igdb_game(game_name, file_extension)
+        return query_igdb_game(
+            game_name, file_extension, igdb_client_id, igdb_access_token
+        )
     else:
         print(f"No valid API configuration for {api_choice}")
         return None
 
 
+# (epoch second, "HH:MM:SS") of the last formatted log timestamp
+_last_log_timestamp = (-1, "")
+
+
+def _log_timestamp():
+    """Return the current time as HH:MM:SS, formatting at most once a second."""
+    global _last_log_timestamp
+    now = int(time.time())
+    second, text = _last_log_timestamp
+    if now != second:
+        text = time.strftime("%H:%M:%S", time.localtime(now))
+        # A single tuple assignment keeps concurrent callers consistent
+        _last_log_timestamp = (now, text)
+    return text
+
+
+def preserve_sequel_numbers(original_name, api_name):
+    """Preserve numbered sequels when API returns generic name."""
+    # Extract numbers from the original name
+    original_numbers = NUMBER_PATTERN.findall(original_name)
+    api_numbers = NUMBER_PATTERN.findall(api_name)
+
+    # If original has numbers but API result doesn't, preserve the original
+    if original_numbers and not api_numbers:
+        return original_name
+
+    # If original has NO numbers but API result DOES have numbers, preserve the original
+    # (API likely returned wrong sequel for the base game)
+    if not original_numbers and api_numbers:
+        return original_name
+
+    # If both have numbers but they're different, preserve the original
+    if original_numbers and api_numbers and original_numbers != api_numbers:
+        return original_name
+
+    return api_name
+
+
+def _unlink_in_dir(file_path, name, dir_fd):
+    """Delete a file by name relative to an open directory, or by full path."""
+    if dir_fd is None:
+        os.unlink(file_path)
+    else:
+        os.unlink(name, dir_fd=dir_fd)
+
+
+def _unified_cache_key(api_choice, game_name, file_extension):
+    """Return the GAME_CACHE key for a lookup through the given API."""
+    return f"{api_choice}|{game_name.strip().lower()}|{file_extension or 'unknown'}"
+
+
+def prefetch_igdb_canonical_names(games, igdb_client_id, igdb_access_token):
+    """Resolve uncached games with batched IGDB queries before a scan.
+
+    Hits are stored in GAME_CACHE exactly as get_unified_canonical_name would
+    store them, so the per-file lookups that follow are cache hits. Games
+    without a batch match are left for the full per-game search.
+
+    Args:
+        games: Iterable of (game_name, file_extension) pairs
+        igdb_client_id: IGDB client id
+        igdb_access_token: IGDB access token
+    """
+    if not (query_igdb_games_batch and igdb_client_id and igdb_access_token):
+        return
+
+    now = time.time()
+    uncached = []
+    for name, ext in dict.fromkeys(games):
+        cached = GAME_CACHE.get(_unified_cache_key("igdb", name, ext))
+        if not (cached and now - cached["ts"] < CACHE_TTL_SECONDS):
+            uncached.append((name, ext))
+    if not uncached:
+        return
+
+    batch = query_igdb_games_batch(uncached, igdb_client_id, igdb_access_token)
+    for (name, ext), result in batch.items():
+        if result:
+            api_result = result.get("canonical_name", name)
+            GAME_CACHE[_unified_cache_key("igdb", name, ext)] = {
+                "name": preserve_sequel_numbers(name, api_result),
+                "ts": int(now),
+            }
+
+
 def get_unified_canonical_name(
     game_name,
     file_extension,
@@ -92,44 +226,36 @@ def get_unified_canonical_name(
     logger=None,
 ):
     """Get canonical name using the selected API with sequel preservation."""
-    import re
-
-    def preserve_sequel_numbers(original_name, api_name):
-        """Preserve numbered sequels when API returns generic name."""
-        # Extract numbers from the original name
-        original_numbers = re.findall(r"\b\d+\b", original_name)
-        api_numbers = re.findall(r"\b\d+\b", api_name)
-
-        # If original has numbers but API result doesn't, preserve the original
-        if original_numbers and not api_numbers:
-            return original_name
-
-        # If original has NO numbers but API result DOES have numbers, preserve the original
-        # (API likely returned wrong sequel for the base game)
-        if not original_numbers and api_numbers:
-            return original_name
-
-        # If both have numbers but they're different, preserve the original
-        if original_numbers and api_numbers and original_numbers != api_numbers:
-            return original_name
-
-        return api_name
+    cache_key = _unified_cache_key(api_choice, game_name, file_extension)
+    cached = GAME_CACHE.get(cache_key)
+    if cached and time.time() - cached["ts"] < CACHE_TTL_SECONDS:
+        return cached["name"]
 
     if api_choice == "thegamesdb":
+        # A missing key or requests is reported once at scan start, not per file
+        tgdb_result = (
+            query_tgdb_game(game_name, file_extension, tgdb_api_key, logger)
+            if requests and tgdb_api_key
+            else None
+        )
+        if tgdb_result:
+            canonical = preserve_sequel_numbers(game_name, tgdb_result["matched_on"])
+            GAME_CACHE[cache_key] = {"name": canonical, "ts": int(time.time())}
+            return canonical
+        # No API match - fall back to fuzzy matching against cached games
         api_result = get_canonical_name(game_name, file_extension, tgdb_api_key, logger)
         return preserve_sequel_numbers(game_name, api_result)
     elif api_choice == "igdb":
         # Use the original IGDB logic from rom_cleanup.py
         if query_igdb_game and igdb_client_id and igdb_access_token:
-            # Set global variables in rom_cleanup module before calling
-            import rom_cleanup
-
-            rom_cleanup.IGDB_CLIENT_ID = igdb_client_id
-            rom_cleanup.IGDB_ACCESS_TOKEN = igdb_access_token
-            result = query_igdb_game(game_name, file_extension)
+            result = query_igdb_game(
+                game_name, file_extension, igdb_client_id, igdb_access_token
+            )
             if result:
                 api_result = result.get("canonical_name", game_name)
-                return preserve_sequel_numbers(game_name, api_result)
+                canonical = preserve_sequel_numbers(game_name, api_result)
+                GAME_CACHE[cache_key] = {"name": canonical, "ts": int(time.time())}
+                return canonical
 
     # Fallback to original name
     return game_name
@@ -183,6 +309,39 @@ logger.addHandler(handler)
 class ROMCleanupGUI:
     """Main GUI application class."""
 
+    # Lowercase ROM extensions recognised by the scanner
+    ROM_EXTENSIONS = frozenset(
+        {
+            ".zip",
+            ".7z",
+            ".rar",
+            ".iso",
+            ".cue",
+            ".bin",
+            ".img",
+            ".smc",
+            ".sfc",
+            ".nes",
+            ".n64",
+            ".z64",
+            ".v64",
+            ".gb",
+            ".gbc",
+            ".gba",
+            ".nds",
+            ".3ds",
+            ".smd",
+            ".gen",
+            ".sms",
+            ".gg",
+            ".32x",
+            ".cdi",
+            ".sat",
+            ".pbp",
+            ".cso",
+        }
+    )
+
     def __init__(self, root: tk.Tk) -> None:
         self.root = root
         self.root.title("ROM Collection Cleanup Tool")
@@ -225,11 +384,22 @@ class ROMCleanupGUI:
         self.current_process = None
         self.process_stop_requested = False
 
+        # Log lines are queued by any thread and drained on the Tk thread
+        self._log_queue: "queue.Queue[str]" = queue.Queue()
+        self._last_ui_update = 0.0
+        self._last_progress = 0.0
+
+        # Shared connection pool for API checks
+        self.http = create_http_session() if requests else None
+
         # Setup GUI
         self.setup_gui(main_frame)
 
-        # Load any saved credentials
-        self.load_saved_credentials()
+        # The settings tab and saved credentials are not needed for the first
+        # frame; build them once the main window has been drawn
+        self.root.after_idle(self._finish_startup)
+
+        self.root.after(LOG_DRAIN_INTERVAL_MS, self._drain_log)
 
     def setup_gui(self, parent: ttk.Frame) -> None:
         """Set up the GUI elements."""
@@ -241,16 +411,13 @@ class ROMCleanupGUI:
         main_frame = ttk.Frame(notebook, padding="20", style="Dark.TFrame")
         notebook.add(main_frame, text="Main")
 
-        # Advanced tab
-        advanced_frame = ttk.Frame(notebook, padding="20", style="Dark.TFrame")
-        notebook.add(advanced_frame, text="Advanced Settings")
+        # Advanced tab (populated by _finish_startup)
+        self._advanced_frame = ttk.Frame(notebook, padding="20", style="Dark.TFrame")
+        notebook.add(self._advanced_frame, text="Advanced Settings")
 
         # Setup main tab
         self.setup_main_tab(main_frame)
 
-        # Setup advanced tab
-        self.setup_advanced_tab(advanced_frame)
-
         # Status and progress section
         status_frame = ttk.Frame(parent, style="Dark.TFrame")
         status_frame.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(20, 0))
@@ -320,6 +487,11 @@ class ROMCleanupGUI:
             button_frame, text="Clear Log", command=self.clear_log, style="Dark.TButton"
         ).grid(row=0, column=2)
 
+    def _finish_startup(self) -> None:
+        """Build the advanced tab and load saved credentials after first paint."""
+        self.setup_advanced_tab(self._advanced_frame)
+        self.load_saved_credentials()
+
     def setup_main_tab(self, parent):
         """Set up the main tab elements."""
         # Directory selection section
@@ -853,7 +1025,7 @@ class ROMCleanupGUI:
             output_widget.insert(tk.END, "Requesting access token from Twitch...\n")
             output_widget.update()
 
-            response = requests.post(url, params=params, timeout=10)
+            response = self.http.post(url, params=params, timeout=10)
 
             if response.status_code == 200:
                 token_data = response.json()
@@ -907,7 +1079,7 @@ class ROMCleanupGUI:
             output_widget.insert(tk.END, "\nTesting IGDB API connection...\n")
             output_widget.update()
 
-            response = requests.post(url, headers=headers, data=query, timeout=10)
+            response = self.http.post(url, headers=headers, data=query, timeout=10)
 
             if response.status_code == 200:
                 games = response.json()
@@ -959,15 +1131,12 @@ class ROMCleanupGUI:
             message: The message to log
         """
         try:
-            timestamp = datetime.now().strftime("%H:%M:%S")
+            timestamp = _log_timestamp()
             formatted_message = f"[{timestamp}] {message}\n"
 
-            # Safely update the text widget
-            if hasattr(self, "log_text") and self.log_text.winfo_exists():
-                self.log_text.config(state=tk.NORMAL)
-                self.log_text.insert(tk.END, formatted_message)
-                self.log_text.see(tk.END)
-                self.log_text.config(state=tk.DISABLED)
+            if hasattr(self, "log_text"):
+                # The widget is only touched from _drain_log on the Tk thread
+                self._log_queue.put(formatted_message)
             else:
                 # Fallback to logger if widget doesn't exist
                 logger.info(message)
@@ -983,8 +1152,60 @@ class ROMCleanupGUI:
         except Exception as e:
             logger.error(f"Error logging message: {e}")
 
+    def log_messages(self, messages: List[str]) -> None:
+        """Queue several log lines at once under one timestamp.
+
+        Unlike log_message, nothing is copied to the clipboard; this is meant
+        for bulk per-file reports.
+
+        Args:
+            messages: The messages to log, in order
+        """
+        if not messages:
+            return
+        if not hasattr(self, "log_text"):
+            for message in messages:
+                logger.info(message)
+            return
+        timestamp = _log_timestamp()
+        self._log_queue.put(
+            "".join(f"[{timestamp}] {message}\n" for message in messages)
+        )
+
+    def _take_queued_logs(self) -> List[str]:
+        """Remove and return every log line currently queued."""
+        items = []
+        while True:
+            try:
+                items.append(self._log_queue.get_nowait())
+            except queue.Empty:
+                return items
+
+    def _drain_log(self) -> None:
+        """Write queued log lines to the widget in one insert, then reschedule.
+
+        Only the last LOG_MAX_LINES lines are kept in the widget.
+        """
+        items = self._take_queued_logs()
+        try:
+            if items and self.log_text.winfo_exists():
+                self.log_text.config(state=tk.NORMAL)
+                self.log_text.insert(tk.END, "".join(items[-LOG_MAX_LINES:]))
+                # "end-1c" is on the empty line after the final newline
+                line_count = int(self.log_text.index("end-1c").split(".")[0]) - 1
+                if line_count > LOG_MAX_LINES:
+                    overflow = line_count - LOG_MAX_LINES
+                    self.log_text.delete("1.0", f"{overflow + 1}.0")
+                self.log_text.see(tk.END)
+                self.log_text.config(state=tk.DISABLED)
+            self.root.after(LOG_DRAIN_INTERVAL_MS, self._drain_log)
+        except tk.TclError as e:
+            # Window is being destroyed
+            logger.debug(f"Log drain stopped: {e}")
+
     def clear_log(self):
         """Clear the log display."""
+        self._take_queued_logs()
         self.log_text.config(state=tk.NORMAL)
         self.log_text.delete(1.0, tk.END)
         self.log_text.config(state=tk.DISABLED)
@@ -1011,7 +1232,7 @@ class ROMCleanupGUI:
             return False, "TheGamesDB API Key not configured"
 
         try:
-            response = requests.get(
+            response = self.http.get(
                 f"https://api.thegamesdb.net/v1/Games/ByGameName?apikey={tgdb_api_key}&name=Mario&fields=games",
                 timeout=10,
             )
@@ -1055,7 +1276,7 @@ class ROMCleanupGUI:
                 "Authorization": f"Bearer {access_token}",
                 "Accept": "application/json",
             }
-            response = requests.post(
+            response = self.http.post(
                 "https://api.igdb.com/v4/games",
                 headers=headers,
                 data="fields name; limit 1;",
@@ -1239,7 +1460,7 @@ class ROMCleanupGUI:
         try:
             self.log_message("Testing connection to TheGamesDB API...")
             # Test with a simple request to get a single game
-            response = requests.get(
+            response = self.http.get(
                 f"https://api.thegamesdb.net/v1/Games/ByGameName?apikey={tgdb_api_key}&name=Mario&fields=games",
                 timeout=10,
             )
@@ -1320,8 +1541,11 @@ class ROMCleanupGUI:
     def scan_roms(self, directory, preferred_region, keep_japanese_only, operation):
         """Scan ROMs and identify duplicates."""
         try:
-            self.status_var.set("Scanning ROMs...")
-            self.progress_var.set(0)
+            self._set_status("Scanning ROMs...")
+            self._set_progress(0, force=True)
+
+            # Lookups must see the persisted cache
+            wait_for_game_cache()
 
             self.log_message(f"Scanning directory: {directory}")
             self.log_message(f"Operation mode: {operation}")
@@ -1337,118 +1561,141 @@ class ROMCleanupGUI:
                 self.log_message(f"WARNING: {message}")
                 self.log_message("Using basic filename matching only")
 
-            # Find all ROM files
-            rom_files = []
-            rom_extensions = {
-                ".zip",
-                ".7z",
-                ".rar",
-                ".iso",
-                ".cue",
-                ".bin",
-                ".img",
-                ".smc",
-                ".sfc",
-                ".nes",
-                ".n64",
-                ".z64",
-                ".v64",
-                ".gb",
-                ".gbc",
-                ".gba",
-                ".nds",
-                ".3ds",
-                ".smd",
-                ".gen",
-                ".sms",
-                ".gg",
-                ".32x",
-                ".cdi",
-                ".sat",
-                ".pbp",
-                ".cso",
-            }
+            # The file count is unknown until the walk and name lookups finish
+            self._set_progress_busy(True)
 
-            for ext in rom_extensions:
-                rom_files.extend(Path(directory).glob(f"**/*{ext}"))
+            # Single directory walk; extensions are matched case-insensitively
+            entries = list(iter_rom_files(directory, self.ROM_EXTENSIONS, skip_dirs=()))
+            rom_files = [Path(entry.path) for entry in entries]
 
             if not rom_files:
                 self.log_message("No ROM files found!")
-                self.status_var.set("No ROMs found")
+                self._set_status("No ROMs found")
                 return
 
             total_files = len(rom_files)
             self.log_message(f"Found {total_files} ROM files")
 
+            # Suffixes are lowercased once from the entry's str name rather
+            # than re-derived through Path.name; only dotted names are yielded
+            extensions = [
+                entry.name[entry.name.rfind(".") :].lower() for entry in entries
+            ]
+
+            # Filename parsing is CPU-bound; large sets are parsed in worker
+            # processes so this thread does not hold the GIL against Tk
+            parsed = parse_rom_filenames([entry.name for entry in entries])
+
+            # Credentials cannot change mid-scan; read the Tk variables once
+            api_choice = self.api_choice.get()
+            tgdb_api_key = self.tgdb_api_key.get().strip()
+            igdb_client_id = self.igdb_client_id.get().strip()
+            igdb_access_token = self.igdb_access_token.get().strip()
+
+            # Resolve unseen names in batched IGDB requests up front
+            if api_choice == "igdb":
+                self._set_status("Looking up game names...")
+                prefetch_igdb_canonical_names(
+                    [
+                        (base_name, ext)
+                        for (base_name, _), ext in zip(parsed, extensions)
+                    ],
+                    igdb_client_id,
+                    igdb_access_token,
+                )
+                self._set_status("Scanning ROMs...")
+
+            self._set_progress_busy(False)
+
             # Group ROMs by canonical name
             rom_groups = defaultdict(list)
+            percent_per_file = 100.0 / total_files
+            # Regional variants share a base name, so resolve each pair once
+            resolved_names = {}
 
-            for i, file_path in enumerate(rom_files):
+            for i, (file_path, file_extension) in enumerate(zip(rom_files, extensions)):
                 # Check if stop was requested
                 if self.process_stop_requested:
                     self.log_message("STOP: Process stopped by user request")
-                    self.status_var.set("Stopped")
+                    self._set_status("Stopped")
                     return
 
                 filename = file_path.name
-                base_name = get_base_name(filename)
-                region = get_region(filename)
-                file_extension = file_path.suffix.lower()
+                base_name, region = parsed[i]
 
                 # Log progress every 100 files or if it's one of the first 10
-                if i < 10 or (i + 1) % 100 == 0:
+                verbose = i < 10 or (i + 1) % 100 == 0
+                if verbose:
                     self.log_message(f"[{i+1}/{total_files}] Processing: {filename}")
                     self.log_message(f"   Base name: {base_name}")
                     self.log_message(f"   Region: {region}")
 
-                # Get user credentials for API calls
-                api_choice = self.api_choice.get()
-                tgdb_api_key = self.tgdb_api_key.get().strip()
-                igdb_client_id = self.igdb_client_id.get().strip()
-                igdb_access_token = self.igdb_access_token.get().strip()
-
-                canonical_name = get_unified_canonical_name(
-                    base_name,
-                    file_extension,
-                    api_choice,
-                    tgdb_api_key,
-                    igdb_client_id,
-                    igdb_access_token,
-                    logger=self.log_message,
-                )
+                name_key = (base_name, file_extension)
+                canonical_name = resolved_names.get(name_key)
+                if canonical_name is None:
+                    canonical_name = get_unified_canonical_name(
+                        base_name,
+                        file_extension,
+                        api_choice,
+                        tgdb_api_key,
+                        igdb_client_id,
+                        igdb_access_token,
+                        logger=self.log_message,
+                    )
+                    resolved_names[name_key] = canonical_name
 
-                # Debug logging for canonical name assignment
+                # Debug logging for canonical name assignment; unchanged names
+                # are only reported alongside the sampled progress lines
                 if base_name != canonical_name:
                     self.log_message(
                         f"   Canonical name: '{base_name}' -> '{canonical_name}'"
                     )
-                else:
+                elif verbose:
                     self.log_message(f"   Canonical name: '{canonical_name}'")
 
                 rom_groups[canonical_name].append((file_path, region, base_name))
 
                 # Update progress
-                progress = ((i + 1) / total_files) * 100
-                self.progress_var.set(progress)
-                self.root.update_idletasks()
+                self._set_progress(
+                    (i + 1) * percent_per_file, force=i + 1 == total_files
+                )
+
+            # Parsed names are not needed once files are grouped
+            clear_parse_caches()
+
+            # Persist API results once per scan rather than per lookup
+            save_game_cache()
 
             # Process groups and identify duplicates
-            self.status_var.set("Analyzing duplicates...")
+            self._set_status("Analyzing duplicates...")
             self.process_duplicates(
-                rom_groups, preferred_region, keep_japanese_only, operation
+                rom_groups,
+                preferred_region,
+                keep_japanese_only,
+                operation,
+                total_roms=total_files,
             )
 
         except Exception as e:
             self.log_message(f"Error during scan: {e}")
-            self.status_var.set("Error occurred")
+            self._set_status("Error occurred")
+        finally:
+            self._set_progress_busy(False)
 
     def process_duplicates(
-        self, rom_groups, preferred_region, keep_japanese_only, operation
+        self,
+        rom_groups,
+        preferred_region,
+        keep_japanese_only,
+        operation,
+        total_roms=None,
     ):
         """Process ROM groups and handle duplicates using ENHANCED logic (cross-regional + same-region)."""
         from rom_cleanup import find_duplicates_to_remove
 
         total_groups = len(rom_groups)
+        if total_roms is None:
+            total_roms = sum(len(files) for files in rom_groups.values())
         self.log_message(
             f"\nAnalyzing {total_groups} game groups with ENHANCED duplicate detection..."
         )
@@ -1464,7 +1711,7 @@ class ROMCleanupGUI:
                 f"🎯 Duplicates found (cross-regional + same-region): {removed_count}"
             )
             self.log_message(
-                f"💡 Best variants preserved: {sum(len(files) for files in rom_groups.values()) - removed_count}"
+                f"💡 Best variants preserved: {total_roms - removed_count}"
             )
 
         except Exception as e:
@@ -1488,8 +1735,8 @@ class ROMCleanupGUI:
         else:
             self.log_message("\nNo duplicate files found!")
 
-        self.status_var.set(f"Complete - {removed_count} duplicates handled")
-        self.progress_var.set(100)
+        self._set_status(f"Complete - {removed_count} duplicates handled")
+        self._set_progress(100, force=True)
 
     def move_files(self, files_to_move):
         """Move files to a subdirectory."""
@@ -1504,33 +1751,22 @@ class ROMCleanupGUI:
 
         self.log_message(f"Moving files to: {removed_dir}")
 
-        for i, file_path in enumerate(files_to_move):
-            # Check if stop was requested
-            if self.process_stop_requested:
-                self.log_message("STOP: Process stopped by user request")
-                self.status_var.set("Process stopped")
-                return
-
-            try:
-                dest_path = removed_dir / file_path.name
-                # Handle name conflicts
-                counter = 1
-                while dest_path.exists():
-                    stem = file_path.stem
-                    suffix = file_path.suffix
-                    dest_path = removed_dir / f"{stem}_{counter}{suffix}"
-                    counter += 1
-
-                shutil.move(str(file_path), str(dest_path))
-                self.log_message(f"  Moved: {file_path.name}")
-
-                # Update progress
-                progress = ((i + 1) / len(files_to_move)) * 100
-                self.progress_var.set(progress)
-                self.root.update_idletasks()
-
-            except Exception as e:
-                self.log_message(f"  Error moving {file_path}: {e}")
+        # Pick destinations up front so concurrent moves never race for a name
+        jobs = []
+        reserved = set()
+        for file_path in files_to_move:
+            dest_path = removed_dir / file_path.name
+            # Handle name conflicts
+            counter = 1
+            while dest_path in reserved or dest_path.exists():
+                stem = file_path.stem
+                suffix = file_path.suffix
+                dest_path = removed_dir / f"{stem}_{counter}{suffix}"
+                counter += 1
+            reserved.add(dest_path)
+            jobs.append((file_path, dest_path))
+
+        self._run_file_jobs(jobs, move_file, "Moved", "moving")
 
     def delete_files(self, files_to_delete):
         """Delete files permanently."""
@@ -1550,44 +1786,199 @@ class ROMCleanupGUI:
 
         self.log_message("Permanently deleting files...")
 
-        for i, file_path in enumerate(files_to_delete):
-            # Check if stop was requested
-            if self.process_stop_requested:
-                self.log_message("STOP: Process stopped by user request")
-                self.status_var.set("Process stopped")
-                return
+        if os.unlink not in os.supports_dir_fd:
+            self._run_file_jobs(
+                [(os.fspath(file_path),) for file_path in files_to_delete],
+                os.unlink,
+                "Deleted",
+                "deleting",
+            )
+            return
 
-            try:
-                file_path.unlink()
-                self.log_message(f"  Deleted: {file_path.name}")
+        # Open each parent directory once and unlink by name relative to it,
+        # so the kernel does not resolve the full path again for every file
+        dir_fds = {}
+        jobs = []
+        try:
+            for file_path in files_to_delete:
+                file_path = os.fspath(file_path)
+                parent, name = os.path.split(file_path)
+                if parent not in dir_fds:
+                    try:
+                        dir_fds[parent] = os.open(parent or ".", os.O_RDONLY)
+                    except OSError:
+                        # The per-file unlink below reports the real error
+                        dir_fds[parent] = None
+                jobs.append((file_path, name, dir_fds[parent]))
+            self._run_file_jobs(jobs, _unlink_in_dir, "Deleted", "deleting")
+        finally:
+            for dir_fd in dir_fds.values():
+                if dir_fd is not None:
+                    os.close(dir_fd)
+
+    def _set_status(self, text: str) -> None:
+        """Set the status bar text from any thread via the Tk event loop.
+
+        Args:
+            text: Status message to display
+        """
+        self.root.after(0, self.status_var.set, text)
+
+    def _set_progress_busy(self, busy: bool) -> None:
+        """Switch the progress bar between an animated busy state and percent.
+
+        Used while the total amount of work is not known yet. Safe to call
+        from any thread and repeatedly with the same value.
+
+        Args:
+            busy: True to animate an indeterminate bar, False to show percent
+        """
+
+        def apply() -> None:
+            if busy:
+                self.progress_bar.configure(mode="indeterminate")
+                self.progress_bar.start(50)
+            else:
+                self.progress_bar.stop()
+                self.progress_bar.configure(mode="determinate")
+                # The animation steps the bound variable; restore the real value
+                self.progress_var.set(self._last_progress)
+
+        self.root.after(0, apply)
+
+    def _set_progress(self, value: float, force: bool = False) -> None:
+        """Update the progress bar at most ~30 times per second.
+
+        Changes smaller than PROGRESS_MIN_STEP percent are also skipped. The
+        update is handed to the Tk event loop with root.after so worker
+        threads never touch the widget directly.
+
+        Args:
+            value: Progress percentage
+            force: Update even if the last update was too recent or too small
+        """
+        now = time.monotonic()
+        if not force and (
+            now - self._last_ui_update < PROGRESS_UPDATE_INTERVAL
+            or abs(value - self._last_progress) < PROGRESS_MIN_STEP
+        ):
+            return
+        self._last_ui_update = now
+        self._last_progress = value
+        self.root.after(0, self.progress_var.set, value)
+
+    def _run_file_jobs(self, jobs, action, done_label, error_label):
+        """Run file operations on a thread pool and report each as it finishes.
+
+        Args:
+            jobs: Argument tuples for action; the first item is the source path
+            action: Callable performing one file operation
+            done_label: Log prefix for completed operations, e.g. "Moved"
+            error_label: Verb used in error messages, e.g. "moving"
+        """
+        total = len(jobs)
+        percent_per_job = 100.0 / total if total else 0.0
+        # Per-file lines are queued in batches rather than one call per file
+        pending_lines = []
+        last_flush = time.monotonic()
+        with ThreadPoolExecutor(max_workers=FILE_OP_WORKERS) as executor:
+            futures = {executor.submit(action, *job): job[0] for job in jobs}
+            for i, future in enumerate(as_completed(futures)):
+                # Check if stop was requested
+                if self.process_stop_requested:
+                    for pending in futures:
+                        pending.cancel()
+                    self.log_messages(pending_lines)
+                    self.log_message("STOP: Process stopped by user request")
+                    self._set_status("Process stopped")
+                    return
+
+                file_name = os.path.basename(os.fspath(futures[future]))
+                try:
+                    future.result()
+                    pending_lines.append(f"  {done_label}: {file_name}")
+                except Exception as e:
+                    pending_lines.append(
+                        f"  Error {error_label} {futures[future]}: {e}"
+                    )
+
+                now = time.monotonic()
+                if (
+                    len(pending_lines) >= FILE_LOG_BATCH_SIZE
+                    or now - last_flush >= LOG_DRAIN_INTERVAL_MS / 1000
+                ):
+                    self.log_messages(pending_lines)
+                    pending_lines = []
+                    last_flush = now
+                    # Show the latest file so long runs visibly progress
+                    self._set_status(f"{done_label}: {file_name}")
 
                 # Update progress
-                progress = ((i + 1) / len(files_to_delete)) * 100
-                self.progress_var.set(progress)
-                self.root.update_idletasks()
+                self._set_progress((i + 1) * percent_per_job, force=i + 1 == total)
 
-            except Exception as e:
-                self.log_message(f"  Error deleting {file_path}: {e}")
+        self.log_messages(pending_lines)
 
 
 def load_game_cache():
-    """Load game database cache from file."""
+    """Load game database cache from file, dropping entries older than the TTL."""
     global GAME_CACHE
-    # Auto-delete cache on startup for always fresh results
-    if CACHE_FILE.exists():
-        try:
-            CACHE_FILE.unlink()
-            print("Cleared cache for fresh API results")
-        except Exception as e:
-            print(f"Warning: Could not clear cache: {e}")
-    GAME_CACHE = {}  # Reset the global cache dictionary
+    GAME_CACHE = {}
+    if not CACHE_FILE.exists():
+        return
+
+    try:
+        if orjson:
+            loaded_cache = orjson.loads(CACHE_FILE.read_bytes())
+        else:
+            with open(CACHE_FILE, "r", encoding="utf-8") as f:
+                loaded_cache = json.load(f)
+    except Exception as e:
+        print(f"Warning: Could not load cache: {e}")
+        return
+
+    if not isinstance(loaded_cache, dict):
+        print("Warning: Cache file has an invalid format, starting fresh")
+        return
+
+    cutoff = time.time() - CACHE_TTL_SECONDS
+    GAME_CACHE = {
+        key: entry
+        for key, entry in loaded_cache.items()
+        if isinstance(entry, dict)
+        and isinstance(entry.get("ts"), (int, float))
+        and entry["ts"] >= cutoff
+        and "name" in entry
+    }
+    print(f"Loaded {len(GAME_CACHE)} entries from game cache")
+
+
+def start_game_cache_load():
+    """Load the game cache on a background thread so the window opens at once."""
+    global _cache_load_thread
+    _cache_load_thread = threading.Thread(target=load_game_cache, daemon=True)
+    _cache_load_thread.start()
+
+
+def wait_for_game_cache():
+    """Block until a background cache load (if any) has finished."""
+    if _cache_load_thread is not None:
+        _cache_load_thread.join()
 
 
 def save_game_cache():
     """Save game database cache to file."""
+    # Never overwrite the file with a cache that has not finished loading
+    wait_for_game_cache()
     try:
-        with open(CACHE_FILE, "w", encoding="utf-8") as f:
-            json.dump(GAME_CACHE, f, indent=2, ensure_ascii=False)
+        # Write to a temporary file and rename so a crash never truncates the cache
+        temp_file = CACHE_FILE.with_suffix(".tmp")
+        if orjson:
+            temp_file.write_bytes(orjson.dumps(GAME_CACHE))
+        else:
+            temp_file.write_text(
+                json.dumps(GAME_CACHE, ensure_ascii=False), encoding="utf-8"
+            )
+        temp_file.replace(CACHE_FILE)
         print(f"Saved {len(GAME_CACHE)} entries to game cache")
     except Exception as e:
         print(f"Warning: Could not save cache: {e}")
@@ -1928,8 +2319,8 @@ def setup_dark_theme(root, style):
 
 def main():
     """Main application entry point"""
-    # Load the game cache on startup
-    load_game_cache()
+    # Load the game cache on startup without delaying the window
+    start_game_cache_load()
 
     # Create and run the GUI
     root = tk.Tk()
@@ -1959,4 +2350,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Frozen builds must not relaunch the GUI in parse worker processes
+    multiprocessing.freeze_support()
     main()
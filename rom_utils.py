@@ -7,40 +7,36 @@ regions from ROM filenames following common naming conventions.
 
 import os
 import re
-from typing import Dict, List, Pattern
-
-# Precompiled region patterns - matches common ROM naming conventions
-REGION_PATTERNS: Dict[str, List[Pattern[str]]] = {
-    "japan": [
-        re.compile(r"\(J\)", re.IGNORECASE),
-        re.compile(r"\(Japan\)", re.IGNORECASE),
-        re.compile(r"\(JP\)", re.IGNORECASE),
-        re.compile(r"\(JPN\)", re.IGNORECASE),
-        re.compile(r"\[J\]", re.IGNORECASE),
-        re.compile(r"\[Japan\]", re.IGNORECASE),
-    ],
-    "usa": [
-        re.compile(r"\(U\)", re.IGNORECASE),
-        re.compile(r"\(USA\)", re.IGNORECASE),
-        re.compile(r"\(US\)", re.IGNORECASE),
-        re.compile(r"\[U\]", re.IGNORECASE),
-        re.compile(r"\[USA\]", re.IGNORECASE),
-        re.compile(r"\[US\]", re.IGNORECASE),
-    ],
-    "europe": [
-        re.compile(r"\(E\)", re.IGNORECASE),
-        re.compile(r"\(Europe\)", re.IGNORECASE),
-        re.compile(r"\(EUR\)", re.IGNORECASE),
-        re.compile(r"\[E\]", re.IGNORECASE),
-        re.compile(r"\[Europe\]", re.IGNORECASE),
-        re.compile(r"\[EUR\]", re.IGNORECASE),
-    ],
-    "world": [
-        re.compile(r"\(W\)", re.IGNORECASE),
-        re.compile(r"\(World\)", re.IGNORECASE),
-        re.compile(r"\[W\]", re.IGNORECASE),
-        re.compile(r"\[World\]", re.IGNORECASE),
-    ],
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Collection, Dict, Iterator, List, Optional, Pattern, Tuple, Union
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:
+    fuzz = None
+    process = None
+
+# Precompiled region patterns - matches common ROM naming conventions. Each
+# region's tags are one alternation; dict order is the detection priority.
+REGION_PATTERNS: Dict[str, Pattern[str]] = {
+    "japan": re.compile(r"\((?:J|Japan|JP|JPN)\)|\[(?:J|Japan)\]", re.IGNORECASE),
+    "usa": re.compile(r"\((?:U|USA|US)\)|\[(?:U|USA|US)\]", re.IGNORECASE),
+    "europe": re.compile(r"\((?:E|Europe|EUR)\)|\[(?:E|Europe|EUR)\]", re.IGNORECASE),
+    "world": re.compile(r"\((?:W|World)\)|\[(?:W|World)\]", re.IGNORECASE),
+}
+# All region tags in one pattern; the named group of a match is its region
+REGION_PATTERN: Pattern[str] = re.compile(
+    "|".join(
+        f"(?P<{region}>{pattern.pattern})"
+        for region, pattern in REGION_PATTERNS.items()
+    ),
+    re.IGNORECASE,
+)
+REGION_PRIORITY: Dict[str, int] = {
+    region: priority for priority, region in enumerate(REGION_PATTERNS)
 }
 
 # Common patterns used across functions
@@ -60,6 +56,12 @@ EDITION_PATTERN: Pattern[str] = re.compile(
 TRAILING_NUMBER_PATTERN: Pattern[str] = re.compile(r"\s*-\s*\d+\s*$")
 WHITESPACE_PATTERN: Pattern[str] = re.compile(r"\s+")
 
+# Parsed results kept per helper; ROM sets repeat the same names across folders
+PARSE_CACHE_SIZE = 16384
+
+# Below this many filenames, process start-up costs more than parsing saves
+PARALLEL_PARSE_THRESHOLD = 5000
+
 # Edition patterns used for version info extraction
 VERSION_EDITION_PATTERNS: List[Pattern[str]] = [
     re.compile(
@@ -124,6 +126,7 @@ def is_multi_disc_game(filenames: List[str]) -> bool:
     return disc_count >= len(filenames) * 0.6
 
 
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
 def get_region(filename: str) -> str:
     """
     Extract region from filename based on common ROM naming patterns.
@@ -145,12 +148,15 @@ def get_region(filename: str) -> str:
     if not filename or not isinstance(filename, str):
         return "unknown"
 
-    for region, patterns in REGION_PATTERNS.items():
-        if any(pattern.search(filename) for pattern in patterns):
-            return region
-    return "unknown"
+    # One scan finds every tag; several tags resolve by REGION_PATTERNS order
+    return min(
+        (match.lastgroup for match in REGION_PATTERN.finditer(filename)),
+        key=REGION_PRIORITY.__getitem__,
+        default="unknown",
+    )
 
 
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
 def get_base_name(filename: str) -> str:
     """
     Extract the base game name by removing region tags, revision info, etc.
@@ -173,9 +179,13 @@ def get_base_name(filename: str) -> str:
     if not filename or not isinstance(filename, str):
         return ""
 
-    # Remove file extension
-    base = os.path.splitext(filename)[0]
+    # Remove file extension, then region tags specifically (not all parentheses)
+    base = REGION_PATTERN.sub("", os.path.splitext(filename)[0])
+    return _clean_base_name(base)
 
+
+def _clean_base_name(base: str) -> str:
+    """Strip the non-region tags from an extension- and region-free stem."""
     # PRESERVE disc information - extract it first
     disc_info = ""
     disc_match = DISC_PATTERN.search(base)
@@ -184,11 +194,6 @@ def get_base_name(filename: str) -> str:
         # Remove the disc info from base temporarily to avoid duplication
         base = base.replace(disc_match.group(0), "")
 
-    # Remove region tags specifically (not all parentheses)
-    for patterns in REGION_PATTERNS.values():
-        for pattern in patterns:
-            base = pattern.sub("", base)
-
     # Remove other common tags but preserve disc info
     # Remove revision info
     base = REVISION_PATTERN.sub("", base)
@@ -210,3 +215,196 @@ def get_base_name(filename: str) -> str:
         base += " " + disc_info.strip()
 
     return base
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_rom_filename(filename: str) -> Tuple[str, str]:
+    """
+    Parse a ROM filename into its base name and region.
+
+    Args:
+        filename: The ROM filename to parse
+
+    Returns:
+        Tuple of (base_name, region)
+
+    Examples:
+        >>> parse_rom_filename("Super Mario Bros. (USA).nes")
+        ('Super Mario Bros.', 'usa')
+    """
+    if not filename or not isinstance(filename, str):
+        return "", "unknown"
+
+    # One region scan serves both results: every match votes for the region,
+    # and matches inside the stem are cut out to form the base name.
+    stem_end = len(os.path.splitext(filename)[0])
+    region = "unknown"
+    pieces = []
+    pos = 0
+    for match in REGION_PATTERN.finditer(filename):
+        if region == "unknown" or (
+            REGION_PRIORITY[match.lastgroup] < REGION_PRIORITY[region]
+        ):
+            region = match.lastgroup
+        if match.end() <= stem_end:
+            pieces.append(filename[pos : match.start()])
+            pos = match.end()
+    pieces.append(filename[pos:stem_end])
+    return _clean_base_name("".join(pieces)), region
+
+
+def clear_parse_caches() -> None:
+    """
+    Drop memoized get_region/get_base_name/parse_rom_filename results.
+
+    Long-lived callers such as the GUI call this once a scan has finished so
+    the parsed names of a large collection are not held between scans.
+    """
+    get_region.cache_clear()
+    get_base_name.cache_clear()
+    parse_rom_filename.cache_clear()
+
+
+def parse_rom_filenames(
+    filenames: List[str], max_workers: Optional[int] = None
+) -> List[Tuple[str, str]]:
+    """
+    Parse many ROM filenames, spreading the work over processes for large sets.
+
+    The regex parsing is pure Python and holds the GIL, so collections of at
+    least PARALLEL_PARSE_THRESHOLD files are parsed in a process pool. Smaller
+    sets, or platforms where a pool cannot be started, are parsed inline.
+
+    Args:
+        filenames: ROM filenames to parse
+        max_workers: Process count for the pool (defaults to CPU count)
+
+    Returns:
+        List of (base_name, region) tuples in the same order as filenames
+    """
+    if len(filenames) >= PARALLEL_PARSE_THRESHOLD:
+        workers = max_workers or os.cpu_count() or 1
+        if workers > 1:
+            chunksize = max(256, len(filenames) // (workers * 4))
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    return list(
+                        pool.map(parse_rom_filename, filenames, chunksize=chunksize)
+                    )
+            except (OSError, BrokenProcessPool):
+                pass
+    return [parse_rom_filename(filename) for filename in filenames]
+
+
+def name_similarity(a: str, b: str) -> float:
+    """
+    Return a 0.0-1.0 similarity ratio between two game names.
+
+    Uses RapidFuzz's compiled Indel ratio when it is installed and falls back
+    to difflib.SequenceMatcher otherwise; both measure matching characters
+    over total length, so thresholds apply to either backend.
+
+    Args:
+        a: First name
+        b: Second name
+
+    Returns:
+        Similarity ratio where 1.0 means identical
+
+    Examples:
+        >>> name_similarity("zelda", "zelda")
+        1.0
+    """
+    if fuzz is not None:
+        return fuzz.ratio(a, b) / 100.0
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def name_similarities(name: str, choices: List[str]) -> List[float]:
+    """
+    Score one name against many candidates in a single call.
+
+    With RapidFuzz installed the whole candidate list is scored in compiled
+    code; otherwise a single SequenceMatcher is reused for every candidate.
+    Ratios equal ``name_similarity(name, choice)`` for each choice.
+
+    Args:
+        name: Name to compare
+        choices: Candidate names
+
+    Returns:
+        List of 0.0-1.0 ratios, one per choice in the same order
+
+    Examples:
+        >>> name_similarities("zelda", ["zelda", "mario"])[0]
+        1.0
+    """
+    if process is not None:
+        scores = [0.0] * len(choices)
+        for _, score, index in process.extract(
+            name, choices, scorer=fuzz.ratio, limit=None
+        ):
+            scores[index] = score / 100.0
+        return scores
+
+    matcher = SequenceMatcher(None)
+    matcher.set_seq1(name)
+    scores = []
+    for choice in choices:
+        matcher.set_seq2(choice)
+        scores.append(matcher.ratio())
+    return scores
+
+
+def iter_rom_files(
+    directory: Union[str, "os.PathLike[str]"],
+    extensions: Optional[Collection[str]],
+    skip_dirs: Collection[str] = ("to_delete",),
+) -> Iterator["os.DirEntry[str]"]:
+    """
+    Walk a directory tree with os.scandir and yield ROM file entries.
+
+    Directory entries carry the file type from the directory listing, so no
+    extra stat call is made per file; ``entry.stat()`` is cached on the entry
+    when callers need size or mtime. Symlinked directories are not followed
+    and unreadable directories are skipped.
+
+    Args:
+        directory: Root directory to walk
+        extensions: Lowercase file extensions (with leading dot) to yield, or
+            None to yield every file
+        skip_dirs: Directory names whose subtrees are not descended into
+
+    Yields:
+        os.DirEntry objects for matching files
+
+    Examples:
+        >>> [e.name for e in iter_rom_files("roms", {".nes"})]  # doctest: +SKIP
+        ['Super Mario Bros. (USA).nes']
+    """
+    pending = [os.fspath(directory)]
+    while pending:
+        current = pending.pop()
+        try:
+            scanner = os.scandir(current)
+        except OSError:
+            continue
+        with scanner:
+            for entry in scanner:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in skip_dirs:
+                            pending.append(entry.path)
+                        continue
+                    if extensions is not None:
+                        # Cheap name check first; is_file() follows symlinks
+                        # and has to stat them
+                        name = entry.name
+                        dot = name.rfind(".")
+                        # Same rule as os.path.splitext: a leading dot is no suffix
+                        if dot <= 0 or name[dot:].lower() not in extensions:
+                            continue
+                    if entry.is_file():
+                        yield entry
+                except OSError:
+                    continue
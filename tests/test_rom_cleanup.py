@@ -1,9 +1,19 @@
 """Tests for rom_cleanup module."""
 
+import json
+import time
+from collections import OrderedDict
 from pathlib import Path
 
+import pytest
+
 import rom_cleanup
 
+# IGDB tests patch the shared session, which only exists with requests installed
+requires_requests = pytest.mark.skipif(
+    rom_cleanup.requests is None, reason="requests is not installed"
+)
+
 
 def _create_file(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -57,3 +67,280 @@ def test_find_duplicates_skip_to_delete(tmp_path, monkeypatch):
 
     assert (tmp_path / "Game (Japan).nes") in to_remove
     assert all("to_delete" not in p.parts for p in to_remove)
+
+
+def test_find_duplicates_keeps_best_same_region_variant(tmp_path):
+    """Same-region variants should keep the release over betas and old revisions."""
+    files = [
+        tmp_path / "Game (USA) (Beta).nes",
+        tmp_path / "Game (USA).nes",
+        tmp_path / "Game (USA) (Rev 1).nes",
+    ]
+    groups = {"game": [(path, "usa", "Game") for path in files]}
+
+    to_remove = rom_cleanup.find_duplicates_to_remove(groups)
+
+    assert to_remove == [files[0], files[1]]
+
+
+def test_move_to_safe_folder_keeps_subdirectories(tmp_path):
+    """Moved ROMs keep their relative path; files outside the root are skipped."""
+    roms = tmp_path / "roms"
+    nested = roms / "nes" / "Game (Japan).nes"
+    outside = tmp_path / "Other (Japan).nes"
+    _create_file(nested)
+    _create_file(outside)
+
+    moved = rom_cleanup.move_to_safe_folder(roms, [nested, outside])
+
+    assert moved == 1
+    assert (roms / "to_delete" / "nes" / "Game (Japan).nes").exists()
+    assert outside.exists()
+
+
+def test_max_pair_similarity_stops_at_threshold():
+    """Pair similarity should short-circuit on identical or close names."""
+    assert rom_cleanup._max_pair_similarity({"game"}, {"game"}) == 1.0
+    ratio = rom_cleanup._max_pair_similarity(
+        {"super game", "zzzz"}, {"super games"}, threshold=0.6
+    )
+    assert ratio >= 0.6
+    assert rom_cleanup._max_pair_similarity({"abc"}, {"xyz"}) == 0.0
+
+
+class _FakeResponse:
+    def __init__(self, payload):
+        self.status_code = 200
+        self._payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+@requires_requests
+def test_query_igdb_games_batch_uses_multiquery(monkeypatch):
+    """Batch lookups should send named sub-queries in one multiquery POST."""
+    monkeypatch.setattr(rom_cleanup, "IGDB_CLIENT_ID", "id")
+    monkeypatch.setattr(rom_cleanup, "IGDB_ACCESS_TOKEN", "token")
+    monkeypatch.setattr(rom_cleanup.time, "sleep", lambda _: None)
+    calls = []
+
+    def fake_post(url, headers, data, timeout):
+        calls.append((url, data))
+        return _FakeResponse(
+            [
+                {"name": "q0", "result": [{"id": 1, "name": "Super Game"}]},
+                {"name": "q1", "result": []},
+            ]
+        )
+
+    monkeypatch.setattr(rom_cleanup._IGDB_SESSION, "post", fake_post)
+    monkeypatch.setattr(rom_cleanup, "_IGDB_RESPONSE_CACHE", OrderedDict())
+
+    results = rom_cleanup.query_igdb_games_batch(
+        [("Super Game", ".nes"), ("Unknown", ".nes")]
+    )
+
+    assert len(calls) == 1
+    assert calls[0][0].endswith("/multiquery")
+    assert 'query games "q0"' in calls[0][1]
+    assert results[("Super Game", ".nes")]["canonical_name"] == "Super Game"
+    assert results[("Unknown", ".nes")] is None
+
+
+def test_token_bucket_sleeps_only_for_deficit(monkeypatch):
+    """The bucket should allow a burst up to capacity, then wait per token."""
+    sleeps = []
+    monkeypatch.setattr(rom_cleanup.time, "sleep", sleeps.append)
+    monkeypatch.setattr(rom_cleanup.time, "monotonic", lambda: 100.0)
+
+    bucket = rom_cleanup.TokenBucket(rate=4.0, capacity=2.0)
+    bucket.acquire()
+    bucket.acquire()
+    assert sleeps == []
+
+    bucket.acquire()
+    assert sleeps == [0.25]
+
+
+def test_move_file_copies_on_cross_device(tmp_path, monkeypatch):
+    """move_file should copy and unlink only when rename crosses devices."""
+    import errno
+
+    src = tmp_path / "a.nes"
+    dst = tmp_path / "b.nes"
+    src.write_bytes(b"rom" * 1000)
+
+    def fake_replace(a, b):
+        raise OSError(errno.EXDEV, "cross-device link")
+
+    monkeypatch.setattr(rom_cleanup.os, "replace", fake_replace)
+
+    rom_cleanup.move_file(src, dst)
+
+    assert not src.exists()
+    assert dst.read_bytes() == b"rom" * 1000
+
+
+def test_move_file_survives_copy_file_range_returning_zero(tmp_path, monkeypatch):
+    """A copy_file_range that copies nothing should fall back, not truncate."""
+    import errno
+
+    src = tmp_path / "a.nes"
+    dst = tmp_path / "b.nes"
+    payload = b"rom" * 1000
+    src.write_bytes(payload)
+
+    def fake_replace(a, b):
+        raise OSError(errno.EXDEV, "cross-device link")
+
+    monkeypatch.setattr(rom_cleanup.os, "replace", fake_replace)
+    monkeypatch.setattr(
+        rom_cleanup.os, "copy_file_range", lambda *args: 0, raising=False
+    )
+
+    rom_cleanup.move_file(src, dst)
+
+    assert dst.read_bytes() == payload
+
+
+def test_move_file_keeps_source_on_partial_copy_file_range(tmp_path, monkeypatch):
+    """A copy_file_range that stops part way should raise and keep the source."""
+    import errno
+
+    src = tmp_path / "a.nes"
+    dst = tmp_path / "b.nes"
+    src.write_bytes(b"rom" * 1000)
+    sent = iter([100, 0])
+
+    def fake_replace(a, b):
+        raise OSError(errno.EXDEV, "cross-device link")
+
+    monkeypatch.setattr(rom_cleanup.os, "replace", fake_replace)
+    monkeypatch.setattr(
+        rom_cleanup.os, "copy_file_range", lambda *args: next(sent), raising=False
+    )
+
+    with pytest.raises(OSError):
+        rom_cleanup.move_file(src, dst)
+
+    assert src.read_bytes() == b"rom" * 1000
+
+
+def test_copy_file_falls_back_to_shutil_copyfile(tmp_path, monkeypatch):
+    """_copy_file should defer to shutil.copyfile when the kernel refuses."""
+    src = tmp_path / "a.nes"
+    dst = tmp_path / "b.nes"
+    payload = bytes(range(256)) * 10
+    src.write_bytes(payload)
+    copies = []
+    real_copyfile = rom_cleanup.shutil.copyfile
+
+    def spy_copyfile(a, b):
+        copies.append(a)
+        return real_copyfile(a, b)
+
+    monkeypatch.setattr(rom_cleanup, "_copy_file_range", lambda *args: False)
+    monkeypatch.setattr(rom_cleanup.shutil, "copyfile", spy_copyfile)
+
+    rom_cleanup._copy_file(src, dst)
+
+    assert copies == [src]
+    assert dst.read_bytes() == payload
+
+
+@requires_requests
+def test_query_igdb_game_uses_explicit_credentials(monkeypatch):
+    """Explicit credentials should be sent without touching module globals."""
+    monkeypatch.setattr(rom_cleanup, "IGDB_CLIENT_ID", None)
+    monkeypatch.setattr(rom_cleanup, "IGDB_ACCESS_TOKEN", None)
+    monkeypatch.setattr(rom_cleanup.time, "sleep", lambda _: None)
+    seen_headers = []
+
+    def fake_post(url, headers, data, timeout):
+        seen_headers.append(headers)
+        return _FakeResponse([{"id": 7, "name": "Zelda"}])
+
+    monkeypatch.setattr(rom_cleanup._IGDB_SESSION, "post", fake_post)
+    monkeypatch.setattr(rom_cleanup, "_IGDB_RESPONSE_CACHE", OrderedDict())
+
+    result = rom_cleanup.query_igdb_game("Zelda", ".nes", "cid", "tok")
+
+    assert result["canonical_name"] == "Zelda"
+    assert seen_headers[0]["Client-ID"] == "cid"
+    assert seen_headers[0]["Authorization"] == "Bearer tok"
+    assert rom_cleanup.IGDB_CLIENT_ID is None
+
+
+@requires_requests
+def test_igdb_post_reuses_identical_queries(monkeypatch):
+    """Repeated identical queries should be served from the response cache."""
+    monkeypatch.setattr(rom_cleanup, "_IGDB_RESPONSE_CACHE", OrderedDict())
+    calls = []
+
+    def fake_post(url, headers, data, timeout):
+        calls.append(data)
+        return _FakeResponse([{"id": 1, "name": "Zelda"}])
+
+    monkeypatch.setattr(rom_cleanup._IGDB_SESSION, "post", fake_post)
+
+    first = rom_cleanup._igdb_post("games", "body", "Zelda", ("id", "tok"))
+    second = rom_cleanup._igdb_post("games", "body", "Zelda", ("id", "tok"))
+
+    assert first == second == [{"id": 1, "name": "Zelda"}]
+    assert calls == ["body"]
+
+
+def test_game_cache_round_trip(tmp_path, monkeypatch):
+    """Saved cache entries should load back unchanged, including non-ASCII."""
+    monkeypatch.setattr(rom_cleanup, "CACHE_FILE", tmp_path / "cache.json")
+    monkeypatch.setattr(rom_cleanup, "GAME_CACHE", {("zelda", ".nes"): "ゼルダ"})
+
+    rom_cleanup.save_game_cache()
+    rom_cleanup.GAME_CACHE = {}
+    rom_cleanup.load_game_cache()
+
+    assert rom_cleanup.GAME_CACHE == {("zelda", ".nes"): "ゼルダ"}
+
+
+def test_canonical_fallback_matches_cached_names(monkeypatch):
+    """The fuzzy fallback picks a close cached name but not a numbered sequel."""
+    monkeypatch.setattr(
+        rom_cleanup,
+        "GAME_CACHE",
+        {
+            ("final fantasy", ".sfc"): "Final Fantasy",
+            ("mega man 2", ".nes"): "Mega Man 2",
+        },
+    )
+    monkeypatch.setattr(rom_cleanup, "query_igdb_game", lambda *args: None)
+
+    assert rom_cleanup.get_canonical_name("Final Fantasie", ".sfc") == "Final Fantasy"
+    assert rom_cleanup.get_canonical_name("Mega Man 3", ".nes") == "Mega Man 3"
+
+
+def test_load_game_cache_drops_expired_entries(tmp_path, monkeypatch):
+    """Entries past the TTL are dropped; legacy bare names are kept."""
+    cache_file = tmp_path / "cache.json"
+    now = int(time.time())
+    cache_file.write_text(
+        json.dumps(
+            {
+                "fresh|.nes": {"name": "Fresh", "ts": now},
+                "stale|.nes": {"name": "Stale", "ts": now - 2 * 86400},
+                "legacy_game_.nes": "Legacy",
+            }
+        )
+    )
+    monkeypatch.setattr(rom_cleanup, "CACHE_FILE", cache_file)
+    monkeypatch.setattr(rom_cleanup, "CACHE_TTL_SECONDS", 86400)
+
+    rom_cleanup.load_game_cache()
+
+    assert rom_cleanup.GAME_CACHE == {
+        ("fresh", ".nes"): "Fresh",
+        ("legacy_game", ".nes"): "Legacy",
+    }
@@ -259,7 +259,7 @@ class TestROMCleanupEdgeCases(unittest.TestCase):
         test_file = self.temp_dir / "test.nes"
         test_file.write_text("Test ROM")
 
-        with patch("shutil.move", side_effect=PermissionError("Permission denied")):
+        with patch("os.replace", side_effect=PermissionError("Permission denied")):
             result = move_to_safe_folder(str(self.temp_dir), [test_file])
 
             # Should handle permission error gracefully
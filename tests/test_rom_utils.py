@@ -1,10 +1,16 @@
 """Tests for ROM utilities module."""
 
 from rom_utils import (
+    clear_parse_caches,
     get_base_name,
     get_region,
     get_version_info,
     is_multi_disc_game,
+    iter_rom_files,
+    name_similarities,
+    name_similarity,
+    parse_rom_filename,
+    parse_rom_filenames,
 )
 
 
@@ -39,6 +45,11 @@ class TestGetRegion:
         assert get_region("Game.nes") == "unknown"
         assert get_region("Title - No Region.snes") == "unknown"
 
+    def test_region_priority(self):
+        """Japan tags take priority when a filename has several regions."""
+        assert get_region("Game (USA) [J].nes") == "japan"
+        assert get_region("Game (Europe) (World).nes") == "europe"
+
 
 class TestGetBaseName:
     """Test the get_base_name function."""
@@ -78,6 +89,20 @@ class TestIntegration:
         assert base_name == "Super Mario Bros. 3"
         assert region == "usa"
 
+    def test_parse_matches_separate_helpers(self):
+        """The single-scan parse agrees with get_base_name and get_region."""
+        for filename in [
+            "Super Mario Bros. 3 (USA) (Rev 1).nes",
+            "Game (Europe) (World).nes",
+            "Final Fantasy VII (Japan) (Disc 2).bin",
+            "Untagged Game.gba",
+            "",
+        ]:
+            assert parse_rom_filename(filename) == (
+                get_base_name(filename),
+                get_region(filename),
+            )
+
     def test_edge_cases(self):
         """Test edge cases."""
         # Multiple parentheses
@@ -137,3 +162,92 @@ class TestIsMultiDiscGame:
             "Game Manual.txt",
         ]
         assert is_multi_disc_game(files)
+
+
+class TestIterRomFiles:
+    """Test the iter_rom_files directory walker."""
+
+    def test_filters_extensions_and_skips_dirs(self, tmp_path):
+        """Only matching files outside skipped directories are yielded."""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "to_delete").mkdir()
+        (tmp_path / "Game (USA).nes").write_text("")
+        (tmp_path / "sub" / "Other (Japan).NES").write_text("")
+        (tmp_path / "notes.txt").write_text("")
+        (tmp_path / "to_delete" / "Old (Japan).nes").write_text("")
+
+        names = sorted(e.name for e in iter_rom_files(tmp_path, {".nes"}))
+
+        assert names == ["Game (USA).nes", "Other (Japan).NES"]
+
+    def test_none_extensions_yields_every_file(self, tmp_path):
+        """Passing None for extensions disables the suffix filter."""
+        (tmp_path / "Game (USA).nes").write_text("")
+        (tmp_path / "README").write_text("")
+
+        names = sorted(e.name for e in iter_rom_files(tmp_path, None))
+
+        assert names == ["Game (USA).nes", "README"]
+
+    def test_matching_name_must_still_be_a_file(self, tmp_path):
+        """A dangling symlink with a ROM suffix is not yielded."""
+        (tmp_path / "Game (USA).nes").write_text("")
+        (tmp_path / "Broken (USA).nes").symlink_to(tmp_path / "missing.nes")
+
+        names = [e.name for e in iter_rom_files(tmp_path, {".nes"})]
+
+        assert names == ["Game (USA).nes"]
+
+    def test_missing_directory_yields_nothing(self, tmp_path):
+        """An unreadable or missing root produces no entries."""
+        assert list(iter_rom_files(tmp_path / "missing", {".nes"})) == []
+
+
+class TestNameSimilarity:
+    """Test the name_similarity function."""
+
+    def test_identical_and_disjoint(self):
+        """Identical names score 1.0 and disjoint names score 0.0."""
+        assert name_similarity("zelda", "zelda") == 1.0
+        assert name_similarity("abc", "xyz") == 0.0
+
+    def test_close_names_score_high(self):
+        """Minor spelling differences keep a high ratio."""
+        assert name_similarity("final fantasy", "final fantasy ii") > 0.8
+
+    def test_batch_matches_pairwise(self):
+        """Batch scoring returns the pairwise ratios in input order."""
+        choices = ["final fantasy ii", "zelda", "final fantasy"]
+        scores = name_similarities("final fantasy", choices)
+        assert scores == [name_similarity("final fantasy", c) for c in choices]
+
+
+class TestParseRomFilenames:
+    """Test bulk filename parsing."""
+
+    def test_preserves_order(self):
+        """Results line up with the input filenames."""
+        names = ["Game (USA).nes", "Game (Japan).nes", "Other (E).md"]
+        assert parse_rom_filenames(names) == [
+            ("Game", "usa"),
+            ("Game", "japan"),
+            ("Other", "europe"),
+        ]
+
+    def test_process_pool_matches_inline(self, monkeypatch):
+        """The process pool path returns the same results as inline parsing."""
+        import rom_utils
+
+        names = [f"Game {i} (USA).nes" for i in range(8)]
+        monkeypatch.setattr(rom_utils, "PARALLEL_PARSE_THRESHOLD", 4)
+        assert parse_rom_filenames(names, max_workers=2) == [
+            (f"Game {i}", "usa") for i in range(8)
+        ]
+
+    def test_clear_parse_caches(self):
+        """Clearing drops memoized parse results."""
+        get_region("Game (USA).nes")
+        get_base_name("Game (USA).nes")
+        clear_parse_caches()
+        assert get_region.cache_info().currsize == 0
+        assert get_base_name.cache_info().currsize == 0
@@ -0,0 +1,30 @@
+"""Tests for tgdb_query cache handling."""
+
+import tgdb_query
+
+
+def test_fallback_matches_cached_games_with_same_extension(monkeypatch):
+    """Cached results for the same extension should be used as a fallback."""
+    monkeypatch.setattr(
+        tgdb_query,
+        "GAME_CACHE",
+        {
+            ("Super Mario Bros", ".nes"): {"canonical_name": "Super Mario Bros."},
+            ("Super Mario Bros", ".sfc"): {"canonical_name": "Wrong Platform"},
+        },
+    )
+
+    result = tgdb_query.get_canonical_name("Super Mario Bros", ".nes", logger=print)
+
+    assert result == "Super Mario Bros."
+
+
+def test_missing_api_key_skips_lookup_logging(monkeypatch):
+    """Without an API key the lookup should fall back silently."""
+    monkeypatch.setattr(tgdb_query, "GAME_CACHE", {})
+    messages = []
+
+    result = tgdb_query.get_canonical_name("Some Game", ".nes", logger=messages.append)
+
+    assert result == "Some Game"
+    assert messages == []
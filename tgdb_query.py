@@ -3,9 +3,10 @@ TheGamesDB query function for ROM cleanup tool.
 Replaces IGDB functionality.
 """
 
-import hashlib
+import re
 import time
-from difflib import SequenceMatcher
+
+from rom_utils import name_similarities
 
 try:
     import requests
@@ -15,6 +16,11 @@ except ImportError:
 # Global cache for game queries
 GAME_CACHE = {}
 
+# Shared keep-alive session; lookups are serialized by the rate limiter, so a
+# single pooled connection is reused instead of a new TLS handshake per call.
+# Retries stay in _try_search_term, which backs off differently on 429 and 403.
+_TGDB_SESSION = requests.Session() if requests else None
+
 # Rate limiting globals
 _last_request_time = 0
 _hour_start = 0
@@ -24,6 +30,12 @@ _requests_this_hour = 0
 MIN_REQUEST_INTERVAL = 1.5  # 1.5 seconds between requests (conservative)
 MAX_REQUESTS_PER_HOUR = 500  # Conservative limit for shared public key
 
+# Search-term cleanup patterns, compiled once rather than on every lookup
+PARENS_PATTERN = re.compile(r"\s*\([^)]*\)")
+SUBTITLE_PATTERN = re.compile(r"\s*-\s*.*$")
+DISC_NUMBER_PATTERN = re.compile(r"\s*(Disc|CD|Disk)\s*\d+.*$", re.IGNORECASE)
+ARTICLE_PATTERN = re.compile(r"\s*(The|A|An)\s+", re.IGNORECASE)
+
 
 def _enforce_rate_limit():
     """Enforce rate limiting to avoid 403 errors."""
@@ -57,8 +69,6 @@ def _enforce_rate_limit():
 
 def _generate_search_terms(game_name):
     """Generate progressive search terms for better database matching."""
-    import re
-
     terms = []
     clean_name = game_name.strip()
 
@@ -66,26 +76,22 @@ def _generate_search_terms(game_name):
     terms.append(clean_name)
 
     # 2. Remove common parenthetical info (language, region, etc.)
-    no_parens = re.sub(r"\s*\([^)]*\)", "", clean_name).strip()
+    no_parens = PARENS_PATTERN.sub("", clean_name).strip()
     if no_parens and no_parens != clean_name:
         terms.append(no_parens)
 
     # 3. Remove subtitle (everything after " - ")
-    no_subtitle = re.sub(r"\s*-\s*.*$", "", no_parens).strip()
+    no_subtitle = SUBTITLE_PATTERN.sub("", no_parens).strip()
     if no_subtitle and no_subtitle != no_parens:
         terms.append(no_subtitle)
 
     # 4. Remove version/disc numbers
-    no_numbers = re.sub(
-        r"\s*(Disc|CD|Disk)\s*\d+.*$", "", no_subtitle, flags=re.IGNORECASE
-    ).strip()
+    no_numbers = DISC_NUMBER_PATTERN.sub("", no_subtitle).strip()
     if no_numbers and no_numbers != no_subtitle:
         terms.append(no_numbers)
 
     # 5. Remove common prefixes/suffixes
-    final_clean = re.sub(
-        r"\s*(The|A|An)\s+", "", no_numbers, flags=re.IGNORECASE
-    ).strip()
+    final_clean = ARTICLE_PATTERN.sub("", no_numbers).strip()
     if final_clean and final_clean != no_numbers:
         terms.append(final_clean)
 
@@ -115,9 +121,7 @@ def query_tgdb_game(game_name, file_extension=None, tgdb_api_key=None, logger=No
         log("ERROR: TGDB_API_KEY not provided - API integration disabled")
         return None
 
-    cache_key = hashlib.md5(
-        f"{game_name}_{file_extension or 'unknown'}".encode()
-    ).hexdigest()
+    cache_key = (game_name, file_extension or "unknown")
 
     if cache_key in GAME_CACHE:
         log(f"Cache hit for: {game_name}")
@@ -166,7 +170,7 @@ def _try_search_term(search_term, tgdb_api_key, original_name, term_index, logge
                 "include": "boxart",
             }
 
-            response = requests.get(url, params=params, timeout=10)
+            response = _TGDB_SESSION.get(url, params=params, timeout=10)
 
             if response.status_code == 429:
                 # Rate limit exceeded - wait longer
@@ -196,16 +200,15 @@ def _try_search_term(search_term, tgdb_api_key, original_name, term_index, logge
 
             scored_matches = []
 
-            for game in games:
-                game_title = game.get("game_title", "")
+            # Compare every title against both original name and search term
+            titles = [game.get("game_title", "").lower() for game in games]
+            ratios_original = name_similarities(original_name.lower(), titles)
+            ratios_search = name_similarities(search_term.lower(), titles)
 
-                # Compare against both original name and search term
-                ratio_original = SequenceMatcher(
-                    None, original_name.lower(), game_title.lower()
-                ).ratio()
-                ratio_search = SequenceMatcher(
-                    None, search_term.lower(), game_title.lower()
-                ).ratio()
+            for game, ratio_original, ratio_search in zip(
+                games, ratios_original, ratios_search
+            ):
+                game_title = game.get("game_title", "")
 
                 # Use the better of the two ratios
                 ratio = max(ratio_original, ratio_search)
@@ -274,10 +277,12 @@ def get_canonical_name(game_name, file_extension=None, tgdb_api_key=None, logger
         else:
             print(message)
 
-    log(f"Looking up canonical name for: {game_name} ({file_extension})")
-
-    # Try TheGamesDB first
-    tgdb_result = query_tgdb_game(game_name, file_extension, tgdb_api_key, logger)
+    # Try TheGamesDB first; without a key or requests go straight to the
+    # cache fallback instead of logging the same error for every file
+    tgdb_result = None
+    if requests and tgdb_api_key:
+        log(f"Looking up canonical name for: {game_name} ({file_extension})")
+        tgdb_result = query_tgdb_game(game_name, file_extension, tgdb_api_key, logger)
     if tgdb_result:
         # Use the actual matched name, not the canonical TGDB name
         canonical = tgdb_result["matched_on"]  # This is the name that actually matched
@@ -289,16 +294,17 @@ def get_canonical_name(game_name, file_extension=None, tgdb_api_key=None, logger
     best_match = None
     best_ratio = 0.0
 
-    for cached_key, cached_result in GAME_CACHE.items():
-        if not cached_result:
-            continue
-
-        if file_extension and not cached_key.endswith(file_extension or "unknown"):
-            continue
-
-        cached_name = cached_result.get("canonical_name", "")
-        ratio = SequenceMatcher(None, game_name.lower(), cached_name.lower()).ratio()
-
+    candidates = [
+        cached_result
+        for cached_key, cached_result in GAME_CACHE.items()
+        if cached_result and not (file_extension and cached_key[1] != file_extension)
+    ]
+    ratios = name_similarities(
+        game_name.lower(),
+        [result.get("canonical_name", "").lower() for result in candidates],
+    )
+
+    for cached_result, ratio in zip(candidates, ratios):
         if ratio > best_ratio and ratio > 0.8:  # High threshold for fallback
             best_ratio = ratio
             best_match = cached_result